@@ -1,18 +1,58 @@
 """
 Main entry point for the Blackjack 2025 application.
+
+The window is shown first; the database and the audio mixer are
+started on background threads right after its first frame is painted. Run with
+--profile-startup to print how long each startup phase took, and with
+--seats N to play N seats (up to 7) at one table.
 """
 
+import argparse
 import sys
-from PySide6.QtWidgets import QApplication
-from src.logic.game_engine import GameEngine
-from src.ui.main_window import MainWindow
+import time
+
+STARTED_AT = time.perf_counter()
+
+
+def parse_args() -> tuple[argparse.Namespace, list[str]]:
+    """Our options, and the remaining arguments (passed on to Qt)."""
+    from src.logic.round_engine import MAX_SEATS
+
+    parser = argparse.ArgumentParser(description="Blackjack 2025")
+    parser.add_argument(
+        "--profile-startup", action="store_true", help="Print startup phase timings"
+    )
+    parser.add_argument(
+        "--seats",
+        type=int,
+        default=1,
+        choices=range(1, MAX_SEATS + 1),
+        metavar=f"1-{MAX_SEATS}",
+        help="Seats at the table (default: 1)",
+    )
+    args, qt_args = parser.parse_known_args()
+    return args, [sys.argv[0]] + qt_args
 
 
 def main():
     """
     Initializes and runs the Qt application.
     """
-    app = QApplication(sys.argv)
+    from src.utils.startup_profile import StartupProfiler
+
+    args, qt_args = parse_args()
+    profile = args.profile_startup
+    profiler = StartupProfiler(enabled=profile, started_at=STARTED_AT)
+
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication
+    from src.logic.game_engine import GameEngine
+    from src.ui.components.card_atlas import card_atlas
+    from src.ui.main_window import MainWindow
+    profiler.mark("imports")
+
+    app = QApplication(qt_args)
+    profiler.mark("QApplication")
 
     # Load the stylesheet
     try:
@@ -21,11 +61,39 @@ def main():
             app.setStyleSheet(style)
     except FileNotFoundError:
         print("Stylesheet 'dark_casino.qss' not found. Running with default style.")
+    profiler.mark("stylesheet")
 
-    # Create the engine and main window
-    game_engine = GameEngine()
+    # Create the engine and main window; storage and audio come later
+    game_engine = GameEngine(defer_services=True, num_seats=args.seats)
+    profiler.mark("engine")
     window = MainWindow(game_engine)
+    profiler.mark("window build")
+    # Flush queued hand history and stats before the process exits
+    app.aboutToQuit.connect(game_engine.shutdown)
+
+    def start_services():
+        profiler.mark("first frame")
+        game_engine.open_storage(background=True)
+        profiler.mark("database start (background)")
+        game_engine.start_audio()
+        profiler.mark("audio start (background)")
+        # Scale every card face now, so the first deal doesn't read from disk
+        card_atlas().preload(dpr=window.devicePixelRatioF())
+        profiler.mark("card images")
+
+    def report():
+        profiler.add("database open (thread)", game_engine.storage_seconds)
+        sound_manager = game_engine.sound_manager
+        if hasattr(sound_manager, "wait_until_ready"):
+            sound_manager.wait_until_ready(10)
+            profiler.add("audio mixer init (thread)", sound_manager.init_seconds)
+        profiler.report()
+
+    if profile:
+        # Only the report waits for the database and the mixer, not the app
+        game_engine.stats_loaded.connect(lambda balance: QTimer.singleShot(0, report))
 
+    window.first_frame.connect(start_services)
     window.show()
 
     # Start the application event loop
@@ -0,0 +1 @@
+# This file makes 'src.analysis' a Python package
@@ -0,0 +1,144 @@
+"""
+Precompiled basic-strategy tables, generated per rule set.
+
+A table holds the best action for every (hand state, dealer upcard)
+pair as a flat byte array indexed by an integer state code, so a bot
+can pick an action with one lookup. Tables are generated with the EV
+oracle against a full shoe, cached on disk under a hash of the rules
+and deck count, and memory-mapped read-only when loaded, so simulator
+worker processes share the same pages instead of each building a copy.
+"""
+
+import hashlib
+import mmap
+import os
+from functools import lru_cache
+
+from src.analysis.dealer_probabilities import full_shoe_composition, remove_card
+from src.analysis.ev_oracle import ACTIONS, action_values
+from src.game.deck import CARDS
+from src.game.hand import Hand
+from src.game.rules import GameRules
+from src.utils.constants import STRATEGY_CACHE_PATH
+
+# Action codes are indices into ev_oracle.ACTIONS.
+STAND, HIT, DOUBLE, SPLIT = range(4)
+
+# Bump when the table layout or generation changes.
+TABLE_VERSION = 1
+
+# --- Table layout ---
+# Every section has one row of ten entries (upcards 2-11) per hand state.
+HARD_OFFSET = 0  # Hard totals 4-21, double not allowed
+DOUBLE_OFFSET = HARD_OFFSET + 18 * 10  # Two-card hard 9-11, double allowed
+SOFT_OFFSET = DOUBLE_OFFSET + 3 * 10  # Soft totals 12-21
+PAIR_OFFSET = SOFT_OFFSET + 10 * 10  # Pairs of A, 2, ..., 10
+TABLE_SIZE = PAIR_OFFSET + 10 * 10
+
+
+def state_code(hand: Hand, upcard: int, can_split: bool = True) -> int:
+    """
+    Maps a hand and the dealer's upcard value (2-11) to its table index.
+    Pass can_split=False once the hand limit has been reached.
+    """
+    column = upcard - 2
+    if can_split and hand.can_split:
+        return PAIR_OFFSET + (hand.hard_value // 2 - 1) * 10 + column
+    value = hand.value
+    if hand.is_soft:
+        return SOFT_OFFSET + (value - 12) * 10 + column
+    if hand.can_double_down:
+        return DOUBLE_OFFSET + (value - 9) * 10 + column
+    return HARD_OFFSET + (min(value, 21) - 4) * 10 + column
+
+
+def _card(value: int):
+    """Any card with the given blackjack value (Ace = 1 or 11)."""
+    value = 11 if value == 1 else value
+    return next(card for card in CARDS if card.value == value)
+
+
+def _representatives():
+    """Yields (table offset, card values, allowed action codes) per row."""
+    for total in range(4, 22):
+        if total <= 11:
+            values = (2, total - 2)
+        elif total <= 20:
+            values = (10, total - 10)
+        else:
+            values = (10, 9, 2)
+        yield HARD_OFFSET + (total - 4) * 10, values, (STAND, HIT)
+    for total in range(9, 12):
+        yield DOUBLE_OFFSET + (total - 9) * 10, (2, total - 2), (STAND, HIT, DOUBLE)
+    for total in range(12, 22):
+        yield SOFT_OFFSET + (total - 12) * 10, (1, total - 11), (STAND, HIT)
+    for value in range(1, 11):
+        yield PAIR_OFFSET + (value - 1) * 10, (value, value), (STAND, HIT, DOUBLE, SPLIT)
+
+
+def generate_table(rules: GameRules, num_decks: int = 6) -> bytes:
+    """Builds a strategy table from the EV oracle against a full shoe."""
+    table = bytearray(TABLE_SIZE)
+    full = full_shoe_composition(num_decks)
+    for offset, values, allowed in _representatives():
+        hand = Hand(cards=[_card(value) for value in values])
+        for upcard in range(2, 12):
+            composition = remove_card(full, upcard)
+            for value in values:
+                composition = remove_card(composition, value)
+            av = action_values(hand, upcard, composition, rules, can_split=SPLIT in allowed)
+            best = max(
+                (code for code in allowed if getattr(av, ACTIONS[code]) is not None),
+                key=lambda code: getattr(av, ACTIONS[code]),
+            )
+            table[offset + upcard - 2] = best
+    return bytes(table)
+
+
+def table_path(rules: GameRules, num_decks: int = 6) -> str:
+    """The on-disk cache file for a rule set."""
+    key = f"{TABLE_VERSION}:{num_decks}:{rules!r}"
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return os.path.join(STRATEGY_CACHE_PATH, f"basic_strategy_{digest}.bin")
+
+
+def ensure_table(rules: GameRules, num_decks: int = 6) -> str:
+    """Generates and caches the table for a rule set if it is missing."""
+    path = table_path(rules, num_decks)
+    if not os.path.exists(path):
+        print(f"Generating basic strategy for {num_decks} decks, {rules}...")
+        table = generate_table(rules, num_decks)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename, so a concurrent reader never sees half a table.
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(table)
+        os.replace(tmp_path, path)
+    return path
+
+
+class BasicStrategy:
+    """A read-only strategy table with O(1) action lookup."""
+
+    def __init__(self, table):
+        self.table = table  # Any buffer of TABLE_SIZE action codes
+
+    def action_code(self, hand: Hand, upcard: int, can_split: bool = True) -> int:
+        return self.table[state_code(hand, upcard, can_split)]
+
+    def action(self, hand: Hand, upcard: int, can_split: bool = True) -> str:
+        return ACTIONS[self.table[state_code(hand, upcard, can_split)]]
+
+
+@lru_cache(maxsize=16)
+def load_basic_strategy(rules: GameRules, num_decks: int = 6) -> BasicStrategy:
+    """
+    Loads (generating on first use) the table for a rule set. The file
+    is memory-mapped read-only, so every process shares one copy.
+    """
+    path = ensure_table(rules, num_decks)
+    with open(path, "rb") as f:
+        table = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(table) != TABLE_SIZE:
+        raise ValueError(f"Corrupt strategy table: {path}")
+    return BasicStrategy(table)
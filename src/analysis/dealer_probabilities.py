@@ -0,0 +1,166 @@
+"""
+Exact probability tables for the dealer's final total.
+
+Given the dealer's upcard and the composition of the cards the rest of
+the dealer's hand will be drawn from, this computes the exact chance
+of finishing on 17-21, busting, or holding a natural. It recurses over
+every draw the dealer can make, memoizing each partial hand, and keeps
+finished tables in an LRU cache keyed on a compact composition tuple,
+so no rounds need to be played.
+"""
+
+from functools import lru_cache
+
+from src.game.deck import DECK_COMPOSITION, Shoe
+from src.game.rules import GameRules
+
+# A composition is a 10-tuple of card counts indexed by value - 1:
+# index 0 = Aces, 1 = Twos, ..., 8 = Nines, 9 = all ten-valued cards.
+Composition = tuple[int, ...]
+
+DEALER_OUTCOMES = ("17", "18", "19", "20", "21", "bust", "blackjack")
+BUST = 5
+BLACKJACK = 6
+
+_CACHE_SIZE = 1 << 12
+
+
+def full_shoe_composition(num_decks: int = 6) -> Composition:
+    """The composition of a complete, undealt shoe."""
+    return tuple(count * num_decks for count in DECK_COMPOSITION)
+
+
+def shoe_composition(shoe: Shoe) -> Composition:
+    """The composition of the cards still in a shoe (kept by the shoe itself)."""
+    return shoe.composition()
+
+
+def add_card(composition: Composition, value: int) -> Composition:
+    """Adds one card of the given blackjack value (Ace = 11 or 1)."""
+    i = 0 if value in (1, 11) else value - 1
+    return composition[:i] + (composition[i] + 1,) + composition[i + 1 :]
+
+
+def remove_card(composition: Composition, value: int) -> Composition:
+    """Removes one card of the given blackjack value (Ace = 11 or 1)."""
+    i = 0 if value in (1, 11) else value - 1
+    if composition[i] <= 0:
+        raise ValueError(f"No card of value {value} left in the composition.")
+    return composition[:i] + (composition[i] - 1,) + composition[i + 1 :]
+
+
+# Cards drawn from a composition are tracked as a packed int with one
+# 4-bit counter per composition index, which makes a cheap memo key.
+DRAWN_SHIFTS = tuple(4 * i for i in range(10))
+DRAWN_MASK = 15
+
+
+def _final_totals(composition: Composition, hits_soft_17: bool):
+    """
+    Returns a memoized function giving the (17, 18, 19, 20, 21, bust)
+    distribution for a dealer hand that still draws from `composition`.
+    The function takes (hard total, has_ace, drawn, number drawn), where
+    `drawn` packs the cards already taken from the composition.
+    """
+    memo: dict[int, tuple[float, ...]] = {}
+    size = sum(composition)
+
+    def final(hard: int, has_ace: bool, drawn: int, num_drawn: int):
+        key = (drawn << 6) | (hard << 1) | has_ace
+        cached = memo.get(key)
+        if cached is not None:
+            return cached
+
+        remaining = size - num_drawn
+        if remaining <= 0:
+            raise ValueError("The composition ran out of cards mid-hand.")
+
+        p17 = p18 = p19 = p20 = p21 = bust = 0.0
+        for i in range(10):
+            shift = DRAWN_SHIFTS[i]
+            count = composition[i] - ((drawn >> shift) & DRAWN_MASK)
+            if not count:
+                continue
+            p = count / remaining
+            new_hard = hard + i + 1
+            new_ace = has_ace or i == 0
+            soft = new_ace and new_hard <= 11
+            total = new_hard + 10 if soft else new_hard
+
+            if total > 21:
+                bust += p
+            elif total < 17 or (total == 17 and soft and hits_soft_17):
+                sub = final(new_hard, new_ace, drawn + (1 << shift), num_drawn + 1)
+                p17 += p * sub[0]
+                p18 += p * sub[1]
+                p19 += p * sub[2]
+                p20 += p * sub[3]
+                p21 += p * sub[4]
+                bust += p * sub[5]
+            elif total == 17:
+                p17 += p
+            elif total == 18:
+                p18 += p
+            elif total == 19:
+                p19 += p
+            elif total == 20:
+                p20 += p
+            else:
+                p21 += p
+
+        result = (p17, p18, p19, p20, p21, bust)
+        memo[key] = result
+        return result
+
+    return final
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def dealer_probabilities(
+    upcard: int, composition: Composition, rules: GameRules
+) -> tuple[float, ...]:
+    """
+    Exact distribution over DEALER_OUTCOMES for the given upcard value
+    (2-11, Ace = 11). `composition` is what the hole card and any
+    further draws come from, i.e. it excludes the upcard.
+    """
+    up = 0 if upcard in (1, 11) else upcard - 1
+    natural_hole = {0: 9, 9: 0}.get(up)
+    final = _final_totals(composition, rules.dealer_hits_on_soft_17)
+    # Treat the upcard as a one-card hand and let the hole card be its
+    # first draw, except that a natural is reported separately.
+    remaining = sum(composition)
+
+    acc = [0.0] * 7
+    for i, count in enumerate(composition):
+        if not count:
+            continue
+        p = count / remaining
+        if i == natural_hole:
+            acc[BLACKJACK] += p
+            continue
+        hard = up + i + 2
+        has_ace = up == 0 or i == 0
+        total = hard + 10 if has_ace and hard <= 11 else hard
+        if total >= 17 and not (
+            total == 17 and has_ace and hard <= 11 and rules.dealer_hits_on_soft_17
+        ):
+            acc[total - 17] += p
+            continue
+        sub = final(hard, has_ace, 1 << DRAWN_SHIFTS[i], 1)
+        for j in range(6):
+            acc[j] += p * sub[j]
+    return tuple(acc)
+
+
+def dealer_probabilities_no_blackjack(
+    upcard: int, composition: Composition, rules: GameRules
+) -> tuple[float, ...]:
+    """
+    The (17, 18, 19, 20, 21, bust) distribution given that the dealer
+    does not hold a natural, which is the situation whenever the
+    player still has a decision to make.
+    """
+    probs = dealer_probabilities(upcard, composition, rules)
+    no_natural = 1.0 - probs[BLACKJACK]
+    return tuple(p / no_natural for p in probs[:BLACKJACK])
@@ -1,38 +1,97 @@
 """
 SoundManager to handle all audio playback using pygame.mixer.
+
+The mixer is started on a background thread so the window never waits
+for the audio device, and each clip is decoded the first time it is
+played. A missing or broken clip only silences that one sound.
+NullSoundManager does nothing and suits headless runs.
 """
 
-import pygame.mixer
+import threading
+import time
 from src.utils.constants import SOUND_ASSET_PATH
 
+# name -> (file, volume 0.0 to 1.0)
+SOUND_FILES = {
+    "deal": ("deal.wav", 0.5),
+    "chip": ("chip.wav", 0.7),
+    "win": ("win.wav", 1.0),
+    "lose": ("lose.wav", 1.0),
+    "bust": ("lose.wav", 1.0),  # Use same as lose
+}
+
+
+class NullSoundManager:
+    """A silent backend with the same interface."""
+
+    def play(self, sound_name: str):
+        pass
+
+    def close(self):
+        pass
+
 
 class SoundManager:
-    def __init__(self):
+    def __init__(self, asset_path: str = SOUND_ASSET_PATH, sound_files: dict = SOUND_FILES):
+        self.asset_path = asset_path
+        self.sound_files = sound_files
+        self.available = False  # Set once the mixer is up
+        self.init_seconds = 0.0  # How long the mixer took to start
+        self._mixer = None
+        self._ready = threading.Event()
+        self._sounds = {}  # name -> decoded Sound, or None if it failed
+        self._thread = threading.Thread(
+            target=self._init_mixer, name="audio-init", daemon=True
+        )
+        self._thread.start()
+
+    def _init_mixer(self):
+        started = time.perf_counter()
         try:
+            import pygame.mixer
             pygame.mixer.init()
-            # Load sounds into memory
-            self.sounds = {
-                "deal": pygame.mixer.Sound(f"{SOUND_ASSET_PATH}deal.wav"),
-                "chip": pygame.mixer.Sound(f"{SOUND_ASSET_PATH}chip.wav"),
-                "win": pygame.mixer.Sound(f"{SOUND_ASSET_PATH}win.wav"),
-                "lose": pygame.mixer.Sound(f"{SOUND_ASSET_PATH}lose.wav"),
-                "bust": pygame.mixer.Sound(
-                    f"{SOUND_ASSET_PATH}lose.wav"
-                ),  # Use same as lose
-            }
-            # Set volume (0.0 to 1.0)
-            self.sounds["deal"].set_volume(0.5)
-            self.sounds["chip"].set_volume(0.7)
-
+            self._mixer = pygame.mixer
+            self.available = True
         except Exception as e:
             print(f"Error initializing sound manager: {e}")
             print("Audio will be disabled.")
-            self.sounds = None
+        finally:
+            self.init_seconds = time.perf_counter() - started
+            self._ready.set()
+
+    def wait_until_ready(self, timeout: float = None) -> bool:
+        """Blocks until the mixer has started (or failed); for tests and tools."""
+        return self._ready.wait(timeout)
+
+    def _sound(self, sound_name: str):
+        if sound_name in self._sounds:
+            return self._sounds[sound_name]
+
+        sound = None
+        entry = self.sound_files.get(sound_name)
+        if entry is not None:
+            file_name, volume = entry
+            try:
+                sound = self._mixer.Sound(f"{self.asset_path}{file_name}")
+                sound.set_volume(volume)
+            except Exception as e:
+                print(f"Error loading sound '{sound_name}': {e}")
+                sound = None
+        self._sounds[sound_name] = sound
+        return sound
 
     def play(self, sound_name: str):
-        """Plays a sound by its key name."""
-        if self.sounds and sound_name in self.sounds:
+        """Plays a sound by its key name. Sounds before the mixer is up are skipped."""
+        if not self._ready.is_set() or not self.available:
+            return
+        sound = self._sound(sound_name)
+        if sound is not None:
             try:
-                self.sounds[sound_name].play()
+                sound.play()
             except Exception as e:
                 print(f"Error playing sound '{sound_name}': {e}")
+
+    def close(self):
+        if self.available:
+            self._mixer.quit()
+            self.available = False
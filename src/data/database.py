@@ -1,16 +1,165 @@
 """
 Handles all database creation and session management
 for loading and saving player stats.
+
+Stats are keyed by (player_id, table_id). Loads and saves take many
+keys at once and run as one query / one executemany, so a table with
+thousands of seats costs a single round trip.
+
+The SQLite engine is tuned for many small writes: WAL journaling,
+synchronous=NORMAL (no fsync per commit), memory-mapped reads and one
+long-lived connection per thread. Tests and simulations can switch to
+an in-memory or throwaway temp-file database with configure_database().
 """
 
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, func, inspect, text, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
 from sqlmodel import SQLModel, create_engine, Session, select
-from src.data.models import PlayerStats
+from src.data.models import (
+    DEFAULT_PLAYER_ID,
+    DEFAULT_TABLE_ID,
+    HandHistory,
+    PlayerStats,
+    SessionStats,
+)
+
+StatsKey = Tuple[str, str]  # (player_id, table_id)
+
+# Keys per SELECT; two bound parameters each, under SQLite's variable limit
+_MAX_KEYS_PER_QUERY = 15_000
 
 # Define the database file
 DATABASE_URL = "sqlite:///blackjack_stats.db"
+MEMORY_URL = "sqlite://"
+
+
+@dataclass(frozen=True)
+class DatabaseConfig:
+    """SQLite connection settings."""
+
+    url: str = DATABASE_URL
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size: int = 64 * 1024 * 1024  # Bytes
+    busy_timeout: int = 5000  # Milliseconds
+
+    @property
+    def in_memory(self) -> bool:
+        return self.url in (MEMORY_URL, "sqlite:///:memory:")
+
+
+def create_db_engine(config: DatabaseConfig = DatabaseConfig()) -> Engine:
+    """Creates a SQLite engine that applies the configured pragmas."""
+    if config.in_memory:
+        # Every session must see the same in-memory database.
+        poolclass = StaticPool
+    else:
+        # One long-lived connection per thread, reused by every session.
+        poolclass = SingletonThreadPool
+
+    # 'check_same_thread' is needed for SQLite.
+    db_engine = create_engine(
+        config.url,
+        connect_args={"check_same_thread": False},
+        poolclass=poolclass,
+    )
+
+    @event.listens_for(db_engine, "connect")
+    def _apply_pragmas(dbapi_connection, _record):
+        cursor = dbapi_connection.cursor()
+        if not config.in_memory:
+            cursor.execute(f"PRAGMA journal_mode={config.journal_mode}")
+        cursor.execute(f"PRAGMA synchronous={config.synchronous}")
+        cursor.execute(f"PRAGMA mmap_size={int(config.mmap_size)}")
+        cursor.execute(f"PRAGMA busy_timeout={int(config.busy_timeout)}")
+        cursor.close()
+
+    return db_engine
+
+
+# The engine used by every function in this module.
+engine = create_db_engine()
+
+
+def configure_database(mode: str = "file", url: Optional[str] = None, **options) -> Engine:
+    """
+    Replaces the module engine. `mode` is "file" (default location or
+    `url`), "memory" (private in-memory database) or "temp" (a fresh
+    file in the temp directory). Extra options go to DatabaseConfig.
+    """
+    global engine
+    if mode == "memory":
+        url = MEMORY_URL
+    elif mode == "temp":
+        fd, path = tempfile.mkstemp(prefix="blackjack_", suffix=".db")
+        os.close(fd)
+        url = f"sqlite:///{path}"
+    elif mode != "file":
+        raise ValueError(f"Unknown database mode: {mode}")
+
+    engine.dispose()
+    engine = create_db_engine(DatabaseConfig(url=url or DATABASE_URL, **options))
+    return engine
+
+
+def _upsert(session: Session, model, key_columns: List[str], rows: List[dict]):
+    """
+    Inserts or updates rows of `model` in one executemany, matching on
+    `key_columns` (which need a unique index). Row ids are left alone.
+    """
+    if not rows:
+        return
+    rows = [{k: v for k, v in row.items() if k != "id"} for row in rows]
+    statement = sqlite_insert(model)
+    statement = statement.on_conflict_do_update(
+        index_elements=key_columns,
+        set_={
+            column: statement.excluded[column]
+            for column in rows[0]
+            if column not in key_columns
+        },
+    )
+    session.connection().execute(statement, rows)
+
+
+def upsert_stats(session: Session, rows: List[dict]):
+    """Inserts or updates PlayerStats rows, keyed by (player_id, table_id)."""
+    _upsert(session, PlayerStats, ["player_id", "table_id"], rows)
+
 
-# Create the engine. 'check_same_thread' is needed for SQLite.
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+def upsert_session_stats(session: Session, rows: List[dict]):
+    """Inserts or updates SessionStats rows, keyed by session_id."""
+    _upsert(session, SessionStats, ["session_id"], rows)
+
+
+def _add_missing_columns(connection):
+    """
+    Brings tables created by older versions up to date: adds new
+    columns (with their scalar defaults) and any missing indexes.
+    """
+    inspector = inspect(connection)
+    for table in SQLModel.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            column_type = column.type.compile(dialect=connection.dialect)
+            default = column.default.arg if column.default is not None else None
+            ddl = f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'
+            if isinstance(default, (int, str)):
+                ddl += " DEFAULT " + (str(default) if isinstance(default, int) else f"'{default}'")
+            connection.execute(text(ddl))
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
 
 
 def create_db_and_tables():
@@ -18,52 +167,108 @@ def create_db_and_tables():
     Called once on startup to create the database and tables if they
     don't already exist.
     """
-    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        _add_missing_columns(connection)
+        SQLModel.metadata.create_all(connection)
+
+
+def load_many_stats(
+    keys: Iterable[StatsKey], create_missing: bool = True
+) -> Dict[StatsKey, PlayerStats]:
+    """
+    Loads the stats for many (player_id, table_id) keys at once.
+    Keys without a row get fresh default stats, which are saved
+    straight away when `create_missing` is set.
+    """
+    keys = list(dict.fromkeys(keys))
+    found: Dict[StatsKey, PlayerStats] = {}
+    with Session(engine, expire_on_commit=False) as session:
+        for start in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+            chunk = keys[start:start + _MAX_KEYS_PER_QUERY]
+            statement = select(PlayerStats).where(
+                tuple_(PlayerStats.player_id, PlayerStats.table_id).in_(chunk)
+            )
+            for stats in session.exec(statement):
+                found[stats.key] = stats
+
+        missing = [
+            PlayerStats(player_id=player_id, table_id=table_id)
+            for player_id, table_id in keys
+            if (player_id, table_id) not in found
+        ]
+        if missing and create_missing:
+            rows = [stats.model_dump(exclude={"id"}) for stats in missing]
+            session.connection().execute(
+                sqlite_insert(PlayerStats).on_conflict_do_nothing(), rows
+            )
+            session.commit()
+
+    for stats in missing:
+        found[stats.key] = stats
+    return found
 
-def load_stats() -> PlayerStats:
+
+def load_stats(
+    player_id: str = DEFAULT_PLAYER_ID, table_id: str = DEFAULT_TABLE_ID
+) -> PlayerStats:
     """
-    Loads player stats from the database.
+    Loads one player's stats from the database.
     If no stats exist (first time playing), it creates them.
-    We will use a single row with ID=1 for the player.
     """
+    key = (player_id, table_id)
+    stats = load_many_stats([key])[key]
+    print(f"Loaded stats: Balance ${stats.balance}")
+    return stats
+
+
+def save_stats(stats_data):
+    """
+    Saves one PlayerStats object, or many of them in one statement.
+    """
+    if isinstance(stats_data, PlayerStats):
+        stats_data = [stats_data]
     with Session(engine) as session:
-        # Try to find the stats row with id=1
-        statement = select(PlayerStats).where(PlayerStats.id == 1)
-        stats = session.exec(statement).first()
-
-        if stats:
-            # Found existing stats
-            print(f"Loaded stats: Balance ${stats.balance}")
-            return stats
-        else:
-            # First time playing. Create new stats.
-            print("No stats found. Creating new player file...")
-            new_stats = PlayerStats(id=1, balance=1000, total_wins=0, total_losses=0)
-            session.add(new_stats)
-            session.commit()
-            session.refresh(new_stats)
-            print(f"New stats created: Balance ${new_stats.balance}")
-            return new_stats
+        upsert_stats(session, [stats.model_dump() for stats in stats_data])
+        session.commit()
+
+
+# --- Queries ---
+
+def leaderboard(table_id: str = DEFAULT_TABLE_ID, limit: int = 10) -> List[PlayerStats]:
+    """The players of a table with the highest balance."""
+    with Session(engine) as session:
+        statement = (
+            select(PlayerStats)
+            .where(PlayerStats.table_id == table_id)
+            .order_by(PlayerStats.balance.desc())
+            .limit(limit)
+        )
+        return list(session.exec(statement))
 
-def save_stats(stats_data: PlayerStats):
+
+def last_rounds(player_id: str = DEFAULT_PLAYER_ID, limit: int = 20) -> List[HandHistory]:
+    """A player's most recent rounds, newest first."""
+    with Session(engine) as session:
+        statement = (
+            select(HandHistory)
+            .where(HandHistory.player_id == player_id)
+            .order_by(HandHistory.id.desc())
+            .limit(limit)
+        )
+        return list(session.exec(statement))
+
+
+def player_ev(player_id: str = DEFAULT_PLAYER_ID) -> Optional[float]:
     """
-    Saves the provided PlayerStats object to the database.
+    A player's realized return per unit wagered over their recorded
+    rounds, or None if they have not wagered anything.
     """
     with Session(engine) as session:
-        # Get the existing row with id=1
-        stats_to_update = session.get(PlayerStats, 1)
-        
-        if stats_to_update:
-            # Update the values
-            stats_to_update.balance = stats_data.balance
-            stats_to_update.total_wins = stats_data.total_wins
-            stats_to_update.total_losses = stats_data.total_losses
-            
-            session.add(stats_to_update)
-            session.commit()
-            # print(f"Stats saved: Balance ${stats_to_update.balance}") # Optional: for debugging
-        else:
-            # This shouldn't happen if load_stats was called, but as a fallback:
-            session.add(stats_data)
-            session.commit()
-            print("Error: Could not find stats to save. Created new entry.")
\ No newline at end of file
+        statement = select(
+            func.sum(HandHistory.total_payout - HandHistory.total_bet),
+            func.sum(HandHistory.total_bet),
+        ).where(HandHistory.player_id == player_id)
+        net, wagered = session.exec(statement).one()
+    if not wagered:
+        return None
+    return net / wagered
@@ -0,0 +1,165 @@
+"""
+Append-only hand history with batched writes.
+
+Every finished round becomes a HandHistory row. Rows are buffered in
+memory and written in one transaction once the batch is full or the
+flush interval has passed, and on close. The latest player and session
+stats ride along in the same transaction, so a batch of N rounds costs
+one commit instead of N.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from src.data import database
+from src.data.models import (
+    DEFAULT_PLAYER_ID,
+    DEFAULT_TABLE_ID,
+    HandHistory,
+    PlayerStats,
+    SessionStats,
+)
+
+
+def _codes(cards) -> str:
+    return ",".join(str(card.code) for card in cards)
+
+
+def history_entry(
+    engine,
+    outcome,
+    player_id: str = DEFAULT_PLAYER_ID,
+    table_id: str = DEFAULT_TABLE_ID,
+    session_id: Optional[str] = None,
+    seat: int = 0,
+) -> HandHistory:
+    """Builds the history row of one seat for a round a RoundEngine just settled."""
+    player = engine.players[seat]
+    hands = player.hands
+    return HandHistory(
+        player_id=player_id,
+        table_id=table_id,
+        session_id=session_id,
+        player_cards="|".join(_codes(hand.cards) for hand in hands),
+        dealer_cards=_codes(engine.dealer.hand.cards),
+        actions=",".join(engine.seat_actions[seat]),
+        bets="|".join(str(hand.bet) for hand in hands),
+        results="|".join(result_str for result_str, _ in outcome.results),
+        insurance=outcome.insurance_bet,
+        total_bet=outcome.total_bet,
+        total_payout=outcome.total_payout,
+        balance=player.balance,
+    )
+
+
+def record_outcome(
+    stats: PlayerStats, session_stats: Optional[SessionStats], outcome, balance: int
+):
+    """Folds a settled round into the lifetime and session aggregates."""
+    if outcome.win_status == 1:
+        stats.total_wins += 1
+    elif outcome.win_status == -1:
+        stats.total_losses += 1
+    else:
+        stats.total_pushes += 1
+    stats.rounds_played += 1
+    stats.total_wagered += outcome.total_bet
+    stats.total_net += outcome.net
+    stats.balance = balance
+
+    if session_stats is not None:
+        if outcome.win_status == 1:
+            session_stats.wins += 1
+        elif outcome.win_status == -1:
+            session_stats.losses += 1
+        else:
+            session_stats.pushes += 1
+        session_stats.rounds_played += 1
+        session_stats.total_wagered += outcome.total_bet
+        session_stats.total_net += outcome.net
+        session_stats.ended_at = datetime.now(timezone.utc)
+
+
+class HandHistoryWriter:
+    """
+    Buffers HandHistory rows (and the latest stats of every player and
+    session seen) and writes them in batches. Call close() at shutdown
+    to write whatever is left. A batch that fails to write is retried on
+    the next flush; after `max_attempts` failed flushes its rows are
+    logged as lost and discarded.
+    """
+
+    def __init__(
+        self,
+        db_engine: Optional[Engine] = None,
+        batch_size: int = 50,
+        flush_interval: float = 5.0,
+        max_attempts: int = 3,
+    ):
+        self.db_engine = db_engine if db_engine is not None else database.engine
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval  # Seconds
+        self.max_attempts = max_attempts
+        self._failures = 0  # Failed flushes of the current batch
+        self._pending: List[HandHistory] = []
+        self._stats: Dict[tuple, dict] = {}
+        self._sessions: Dict[str, dict] = {}
+        self._last_flush = time.monotonic()
+
+    def record(
+        self,
+        entry: HandHistory,
+        stats: Optional[PlayerStats] = None,
+        session_stats: Optional[SessionStats] = None,
+    ):
+        """Queues a round, plus snapshots of the stats after it."""
+        self._pending.append(entry)
+        if stats is not None:
+            self._stats[stats.key] = stats.model_dump()
+        if session_stats is not None:
+            self._sessions[session_stats.session_id] = session_stats.model_dump()
+        if (
+            len(self._pending) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self):
+        """Writes all buffered rows and the stats in one transaction."""
+        self._last_flush = time.monotonic()
+        if not self._pending and not self._stats and not self._sessions:
+            return
+
+        try:
+            with Session(self.db_engine) as session:
+                session.add_all(self._pending)
+                database.upsert_stats(session, list(self._stats.values()))
+                database.upsert_session_stats(session, list(self._sessions.values()))
+                session.commit()
+        except Exception:
+            self._failures += 1
+            if self._failures >= self.max_attempts:
+                print(
+                    f"Dropping {len(self._pending)} unsaved rounds "
+                    f"after {self._failures} failed writes."
+                )
+                self._discard()
+            raise
+
+        self._discard()
+
+    def _discard(self):
+        self._pending = []
+        self._stats = {}
+        self._sessions = {}
+        self._failures = 0
+
+    def close(self):
+        self.flush()
+
+    def __len__(self) -> int:
+        return len(self._pending)
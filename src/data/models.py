@@ -1,16 +1,96 @@
 """
-Defines the SQLModel table for storing player statistics.
+Defines the SQLModel tables for player statistics and hand history.
 """
 
+from datetime import datetime, timezone
 from typing import Optional
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
+from src.utils.constants import DEFAULT_PLAYER_ID, DEFAULT_TABLE_ID
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
 
 class PlayerStats(SQLModel, table=True):
     """
-    A table to store player stats. We'll use a single row with id=1.
+    Lifetime stats for one player at one table.
+    Rows are keyed by (player_id, table_id); `id` is only a row id.
     """
+    __table_args__ = (
+        Index("ux_playerstats_player_table", "player_id", "table_id", unique=True),
+        # Leaderboards rank the players of a table by balance or net
+        Index("ix_playerstats_table_balance", "table_id", "balance"),
+        Index("ix_playerstats_table_net", "table_id", "total_net"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
+    player_id: str = Field(default=DEFAULT_PLAYER_ID)
+    table_id: str = Field(default=DEFAULT_TABLE_ID)
     balance: int = Field(default=1000)
     total_wins: int = Field(default=0)
     total_losses: int = Field(default=0)
-    # We could add more stats here later, like 'blackjacks_hit'
\ No newline at end of file
+    total_pushes: int = Field(default=0)
+    rounds_played: int = Field(default=0)
+    total_wagered: int = Field(default=0)  # Including doubles, splits and insurance
+    total_net: int = Field(default=0)  # Winnings minus stakes
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return (self.player_id, self.table_id)
+
+
+class SessionStats(SQLModel, table=True):
+    """
+    Aggregates for one play session (one run of the app, or one seat's
+    stint at a table in a simulation).
+    """
+    __table_args__ = (
+        Index("ix_sessionstats_player_started", "player_id", "started_at"),
+        Index("ix_sessionstats_table_started", "table_id", "started_at"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    session_id: str = Field(unique=True)
+    player_id: str = Field(default=DEFAULT_PLAYER_ID)
+    table_id: str = Field(default=DEFAULT_TABLE_ID)
+    started_at: datetime = Field(default_factory=_utc_now)
+    ended_at: datetime = Field(default_factory=_utc_now)  # Last settled round
+    rounds_played: int = 0
+    wins: int = 0
+    losses: int = 0
+    pushes: int = 0
+    total_wagered: int = 0
+    total_net: int = 0
+
+
+class HandHistory(SQLModel, table=True):
+    """
+    One row per finished round, with everything needed to replay it.
+    Cards are stored as comma-separated card codes (see src.game.deck);
+    per-hand columns separate split hands with '|'.
+    """
+    __table_args__ = (
+        # "Last N rounds" for a player or a table: ORDER BY id DESC
+        Index("ix_handhistory_player_recent", "player_id", "id"),
+        Index("ix_handhistory_table_recent", "table_id", "id"),
+        # Covers per-player EV (SUM(total_payout - total_bet) / SUM(total_bet))
+        Index("ix_handhistory_player_ev", "player_id", "total_bet", "total_payout"),
+        Index("ix_handhistory_session", "session_id"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    played_at: datetime = Field(default_factory=_utc_now)
+    player_id: str = Field(default=DEFAULT_PLAYER_ID)
+    table_id: str = Field(default=DEFAULT_TABLE_ID)
+    session_id: Optional[str] = None
+    player_cards: str = ""  # e.g. "12,25|7,3,9"
+    dealer_cards: str = ""  # Hole card first, then the upcard and any draws
+    actions: str = ""  # e.g. "deal,split,hit,stand,stand"
+    bets: str = ""  # Per hand, e.g. "10|20"
+    results: str = ""  # get_hand_result strings per hand
+    insurance: int = 0
+    total_bet: int = 0
+    total_payout: int = 0
+    balance: int = 0  # Balance after the round was settled
@@ -0,0 +1,100 @@
+"""
+Background persistence for the Qt app.
+
+A dedicated writer thread owns the database connection and a
+HandHistoryWriter. The UI thread only puts a snapshot of the finished
+round on a bounded queue and returns; if the disk falls far enough
+behind that the queue fills up, submit() blocks until the writer has
+caught up (backpressure).
+"""
+
+import queue
+import threading
+from typing import Optional
+
+from src.data.history import HandHistoryWriter
+from src.data.models import HandHistory, PlayerStats, SessionStats
+
+# Tells the writer thread to flush and exit.
+_STOP = object()
+
+
+class PersistenceWorker:
+    """
+    Writes hand history and stats on a background thread.
+
+    max_pending: queue capacity; submit() blocks while it is full.
+    writer: the HandHistoryWriter used on the writer thread.
+    """
+
+    def __init__(
+        self,
+        writer: Optional[HandHistoryWriter] = None,
+        max_pending: int = 256,
+    ):
+        self.writer = writer if writer is not None else HandHistoryWriter()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="persistence-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self,
+        entry: HandHistory,
+        stats: Optional[PlayerStats] = None,
+        session_stats: Optional[SessionStats] = None,
+    ):
+        """
+        Queues a round and copies of the stats after it.
+        Blocks only while the queue is full.
+        """
+        if self._closed:
+            raise RuntimeError("PersistenceWorker is closed.")
+        self._queue.put((
+            entry,
+            stats.model_copy() if stats is not None else None,
+            session_stats.model_copy() if session_stats is not None else None,
+        ))
+
+    def close(self, timeout: Optional[float] = 10.0):
+        """Writes everything still queued and stops the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            print("Persistence writer did not finish; some rounds may be lost.")
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+    # --- Writer thread ---
+
+    def _run(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=self.writer.flush_interval)
+            except queue.Empty:
+                # Idle: write whatever the batch is holding.
+                self._flush()
+                continue
+
+            if item is _STOP:
+                break
+            try:
+                self.writer.record(*item)
+            except Exception as e:
+                # Rows stay buffered and are retried on the next flush
+                # (up to the writer's max_attempts, then dropped).
+                print(f"Error saving hand history: {e}")
+
+        self._flush()
+
+    def _flush(self):
+        try:
+            self.writer.flush()
+        except Exception as e:
+            print(f"Error saving hand history: {e}")
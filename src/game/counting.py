@@ -0,0 +1,149 @@
+"""
+Running and true counts for card-counting systems.
+
+A CountTracker is attached to a Shoe, sees every card code the shoe
+deals and is reset whenever the shoe is rebuilt. All systems are
+tracked in one packed integer: every card code maps to a precomputed
+packed tag, so updating any number of systems costs one integer add
+(plus one subtraction for the cards-remaining counter). Reading a
+running or true count is O(1).
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from src.game.deck import NUM_CARDS, RANK_INDICES, RANKS
+
+
+@dataclass(frozen=True)
+class CountingSystem:
+    """
+    A tag per rank, in Rank order (2, 3, ..., 10, J, Q, K, A).
+    Unbalanced systems (tags summing to non-zero over a deck) start from
+    the usual initial running count of -deck_sum * (num_decks - 1),
+    e.g. 4 - 4 * num_decks for KO.
+    """
+
+    name: str
+    tags: tuple[int, ...]
+
+    def __post_init__(self):
+        if len(self.tags) != len(RANKS):
+            raise ValueError(f"{self.name}: need one tag per rank ({len(RANKS)}).")
+
+    @property
+    def deck_sum(self) -> int:
+        return 4 * sum(self.tags)
+
+    @property
+    def is_balanced(self) -> bool:
+        return self.deck_sum == 0
+
+    def initial_count(self, num_decks: int) -> int:
+        return -self.deck_sum * (num_decks - 1)
+
+    def tag(self, code: int) -> int:
+        """The tag of one card code."""
+        return self.tags[RANK_INDICES[code]]
+
+
+#                            2  3  4  5  6  7  8  9 10  J  Q  K  A
+HI_LO = CountingSystem("Hi-Lo", (1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1, -1))
+KO = CountingSystem("KO", (1, 1, 1, 1, 1, 1, 0, 0, -1, -1, -1, -1, -1))
+OMEGA_II = CountingSystem("Omega II", (1, 1, 2, 2, 2, 1, 0, -1, -2, -2, -2, -2, 0))
+
+DEFAULT_SYSTEMS = (HI_LO, KO, OMEGA_II)
+
+# Each system gets a 32-bit field in the packed count, stored with a bias
+# so every field stays non-negative and can be read back independently.
+_FIELD_BITS = 32
+_FIELD_MASK = (1 << _FIELD_BITS) - 1
+_BIAS = 1 << (_FIELD_BITS - 1)
+
+
+class CountTracker:
+    """Running counts for several systems over one shoe."""
+
+    def __init__(self, systems: Iterable[CountingSystem] = DEFAULT_SYSTEMS, num_decks: int = 6):
+        self.systems = tuple(systems)
+        if not self.systems:
+            raise ValueError("Need at least one counting system.")
+        self.num_decks = num_decks
+        self._index = {system.name: i for i, system in enumerate(self.systems)}
+        self._shifts = tuple(_FIELD_BITS * i for i in range(len(self.systems)))
+
+        # Packed tag of every card code, and the packed starting counts
+        self._packed_tags = tuple(
+            sum(system.tag(code) << shift for system, shift in zip(self.systems, self._shifts))
+            for code in range(NUM_CARDS)
+        )
+        self._packed_start = self._start(num_decks)
+        self._packed = self._packed_start
+        self.remaining = NUM_CARDS * num_decks  # Cards left in the shoe
+
+    def _start(self, num_decks: int) -> int:
+        return sum(
+            (system.initial_count(num_decks) + _BIAS) << shift
+            for system, shift in zip(self.systems, self._shifts)
+        )
+
+    # --- Updates (called by Shoe) ---
+
+    def reset(self, cards_in_shoe: Optional[int] = None, num_decks: Optional[int] = None):
+        """
+        A fresh shoe: counts back to their starting values. The Shoe
+        passes its own deck count, so the two can never disagree.
+        """
+        if num_decks is not None and num_decks != self.num_decks:
+            self.num_decks = num_decks
+            self._packed_start = self._start(num_decks)
+        self._packed = self._packed_start
+        self.remaining = cards_in_shoe if cards_in_shoe is not None else NUM_CARDS * self.num_decks
+
+    def observe(self, code: int):
+        """Counts one dealt card."""
+        self._packed += self._packed_tags[code]
+        self.remaining -= 1
+
+    # --- Reads ---
+
+    @property
+    def decks_remaining(self) -> float:
+        return self.remaining / 52
+
+    def running_count(self, system: str = HI_LO.name, hidden: Iterable[int] = ()) -> int:
+        """
+        The running count of one system. `hidden` are codes dealt but not
+        yet seen (e.g. the dealer's hole card); their tags are left out.
+        """
+        shift = self._shifts[self._index[system]]
+        packed = self._packed
+        for code in hidden:
+            packed -= self._packed_tags[code]
+        return ((packed >> shift) & _FIELD_MASK) - _BIAS
+
+    def true_count(self, system: str = HI_LO.name, hidden: Iterable[int] = ()) -> float:
+        """Running count per remaining (unseen) deck."""
+        hidden = tuple(hidden)
+        decks = (self.remaining + len(hidden)) / 52
+        return self.running_count(system, hidden) / decks if decks > 0 else 0.0
+
+    def counts(self, hidden: Iterable[int] = ()) -> dict[str, tuple[int, float]]:
+        """
+        {system name: (running count, true count)} for every system.
+        `hidden` are codes dealt but not yet seen (e.g. the dealer's hole
+        card): they are left out of the counts and treated as unseen.
+        """
+        packed, remaining = self._packed, self.remaining
+        for code in hidden:
+            packed -= self._packed_tags[code]
+            remaining += 1
+        decks = remaining / 52
+        counts = {}
+        for system, shift in zip(self.systems, self._shifts):
+            running = ((packed >> shift) & _FIELD_MASK) - _BIAS
+            counts[system.name] = (running, running / decks if decks > 0 else 0.0)
+        return counts
+
+    def tag(self, system: str, code: int) -> int:
+        return self.systems[self._index[system]].tag(code)
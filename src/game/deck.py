@@ -4,9 +4,14 @@ We use dataclasses for clean, type-safe models.
 """
 
 import random
+from array import array
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from src.game.counting import CountTracker
+    from src.game.shuffle_pool import ShufflePool
 
 
 class Suit(str, Enum):
@@ -36,40 +41,73 @@ class Rank(str, Enum):
 class Card:
     rank: Rank
     suit: Suit
+    # The compact integer encoding of this card (0-51), stored once so
+    # snapshots and history can read it as a plain attribute.
+    code: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "code", _SUIT_INDEX[self.suit] * 13 + _RANK_INDEX[self.rank])
 
     @property
     def value(self) -> int:
-        if self.rank in [Rank.JACK, Rank.QUEEN, Rank.KING]:
-            return 10
-        if self.rank == Rank.ACE:
-            return 11
-        return int(self.rank.value)
+        return _RANK_VALUE[self.rank]
+
+    @classmethod
+    def from_code(cls, code: int) -> "Card":
+        """Returns the shared Card instance for an integer code."""
+        return CARDS[code]
 
     def __str__(self) -> str:
         return f"{self.rank.value} of {self.suit.value}"
 
     @property
     def image_name(self) -> str:
-        suit_str = self.suit.value.lower()
-        rank_str = ""
-        if self.rank.value.isdigit():
-            num_val = int(self.rank.value)
-            if num_val == 10:
-                rank_str = "10"
-            else:
-                rank_str = f"0{num_val}"
-        else:
-            rank_str = self.rank.value[0]
-        return f"card_{suit_str}_{rank_str}.png"
+        return IMAGE_NAMES[self.code]
+
+
+# --- Compact card encoding ---
+# Every card is a small int: code = suit_index * 13 + rank_index, using the
+# Enum declaration order (so 0 = 2 of Hearts, 51 = Ace of Spades).
+# The tables below are indexed by code and replace per-card computation.
+SUITS = tuple(Suit)
+RANKS = tuple(Rank)
+NUM_CARDS = len(SUITS) * len(RANKS)
+
+_SUIT_INDEX = {suit: i for i, suit in enumerate(SUITS)}
+_RANK_INDEX = {rank: i for i, rank in enumerate(RANKS)}
+_RANK_VALUE = {
+    rank: 11 if rank == Rank.ACE else 10 if i >= _RANK_INDEX[Rank.TEN] else i + 2
+    for i, rank in enumerate(RANKS)
+}
+
+
+def _image_name(rank: Rank, suit: Suit) -> str:
+    rank_str = rank.value.zfill(2) if rank.value.isdigit() else rank.value
+    return f"card_{suit.value.lower()}_{rank_str}.png"
+
+
+# Blackjack value of each code (Ace = 11), and its rank index (0-12).
+RANK_VALUES = bytes(_RANK_VALUE[rank] for suit in SUITS for rank in RANKS)
+RANK_INDICES = bytes(_RANK_INDEX[rank] for suit in SUITS for rank in RANKS)
+# Composition index of each code: Ace = 0, Two = 1, ..., Nine = 8 and every
+# ten-valued card = 9 (see src.analysis.dealer_probabilities).
+COMPOSITION_INDICES = bytes(0 if value == 11 else value - 1 for value in RANK_VALUES)
+DECK_COMPOSITION = tuple(COMPOSITION_INDICES.count(i) for i in range(10))
+IMAGE_NAMES = tuple(_image_name(rank, suit) for suit in SUITS for rank in RANKS)
+
+# One shared, immutable Card per code. Cards are frozen, so handing the same
+# instance out repeatedly is safe and costs no allocation.
+CARDS = tuple(Card(rank, suit) for suit in SUITS for rank in RANKS)
 
 
 class Deck:
-    def __init__(self):
-        self.cards: List[Card] = [Card(rank, suit) for suit in Suit for rank in Rank]
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng if rng is not None else random.Random()
+        self.cards: List[Card] = list(CARDS)
         self.shuffle()
 
     def shuffle(self):
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
 
     def deal(self) -> Card | None:
         if not self.cards:
@@ -78,32 +116,95 @@ class Deck:
 
 
 class Shoe:
-    def __init__(self, num_decks: int = 6):
+    """
+    A multi-deck shoe stored as a bytearray of card codes.
+    Dealing moves a cursor forward instead of popping from a list.
+    With a ShufflePool, reshuffles take a pre-shuffled shoe from the pool.
+    Pass a seeded `rng` (see src.game.rng) for reproducible shoes.
+    A `counter` (see src.game.counting) sees every dealt card and is
+    reset whenever the shoe is rebuilt. Penetration reshuffles happen
+    between rounds (reshuffle_if_due); mid-round the shoe is only
+    rebuilt if it runs out completely.
+    The shoe also keeps how many cards of each composition index are
+    left; composition() returns them as a hashable tuple.
+    """
+
+    def __init__(
+        self,
+        num_decks: int = 6,
+        verbose: bool = True,
+        shuffle_pool: Optional["ShufflePool"] = None,
+        rng: Optional[random.Random] = None,
+        counter: Optional["CountTracker"] = None,
+    ):
+        if shuffle_pool is not None and shuffle_pool.num_decks != num_decks:
+            raise ValueError("The shuffle pool was built for a different deck count.")
         self.num_decks = num_decks
-        self.cards: List[Card] = []
+        self.verbose = verbose  # Simulations turn off the reshuffle messages
+        self.shuffle_pool = shuffle_pool
+        self.rng = rng if rng is not None else random.Random()
+        self.counter = counter
+        self._codes = bytearray()
+        self._cursor = 0
+        self._remaining = array("H", [0] * 10)  # Cards left per composition index
         self.penetration_marker = 0.75
         self.build_shoe()
 
     def build_shoe(self):
-        self.cards = []
-        for _ in range(self.num_decks):
-            deck = Deck()
-            self.cards.extend(deck.cards)
-        random.shuffle(self.cards)
-        self.reshuffle_threshold = int(len(self.cards) * (1 - self.penetration_marker))
-
-    def deal(self) -> Card:
-        if len(self.cards) < self.reshuffle_threshold:
+        if self.shuffle_pool is not None:
+            self._codes = self.shuffle_pool.next_shoe()
+        else:
+            self._codes = bytearray(range(NUM_CARDS)) * self.num_decks
+            self.rng.shuffle(self._codes)
+        self._cursor = 0
+        # Every shoe (including the pool's) holds num_decks complete decks
+        self._remaining = array("H", [count * self.num_decks for count in DECK_COMPOSITION])
+        self.reshuffle_threshold = int(len(self._codes) * (1 - self.penetration_marker))
+        if self.counter is not None:
+            self.counter.reset(len(self._codes), self.num_decks)
+
+    def reshuffle_if_due(self) -> bool:
+        """
+        Rebuilds the shoe once the penetration marker has been reached.
+        Called between rounds, so a round's cards (the hole card among
+        them) always come from one shoe and its count.
+        """
+        if len(self._codes) - self._cursor >= self.reshuffle_threshold:
+            return False
+        if self.verbose:
             print("--- Reached penetration marker. Reshuffling shoe. ---")
-            self.build_shoe()
+        self.build_shoe()
+        return True
 
-        if not self.cards:
-            print("--- Shoe is empty. Building new shoe. ---")
+    def deal_code(self) -> int:
+        """Deals the next card as an integer code."""
+        if self._cursor == len(self._codes):
+            if self.verbose:
+                print("--- Shoe is empty. Building new shoe. ---")
             self.build_shoe()
 
-        # --- FIX: Return a NEW Card instance ---
-        original_card = self.cards.pop()
-        return Card(rank=original_card.rank, suit=original_card.suit)
+        code = self._codes[self._cursor]
+        self._cursor += 1
+        self._remaining[COMPOSITION_INDICES[code]] -= 1
+        if self.counter is not None:
+            self.counter.observe(code)
+        return code
+
+    def deal(self) -> Card:
+        """Deals the next card as a (shared) Card instance."""
+        return CARDS[self.deal_code()]
+
+    def composition(self) -> tuple[int, ...]:
+        """
+        Cards left per composition index (Ace, 2, ..., 9, tens) as an
+        immutable tuple, usable as a memoization key. O(1) in shoe size.
+        """
+        return tuple(self._remaining)
+
+    @property
+    def cards(self) -> List[Card]:
+        """The cards still in the shoe, next card first."""
+        return [CARDS[code] for code in self._codes[self._cursor:]]
 
     def __len__(self) -> int:
-        return len(self.cards)
\ No newline at end of file
+        return len(self._codes) - self._cursor
@@ -4,7 +4,7 @@ Contains the logic for a single hand of Blackjack.
 
 from dataclasses import dataclass, field
 from typing import List
-from src.game.deck import Card  # We import from our own module
+from src.game.deck import Card, Rank  # We import from our own module
 
 
 @dataclass
@@ -16,43 +16,57 @@ class Hand:
     cards: List[Card] = field(default_factory=list)
     is_split: bool = False
     bet: int = 0
+    # Running totals, kept in sync by add_card/pop_card so that
+    # value, is_soft, is_bust and is_blackjack are O(1).
+    hard_value: int = field(default=0, init=False, repr=False)  # Aces count 1
+    num_aces: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self):
+        for card in self.cards:
+            self._count(card, 1)
+
+    def _count(self, card: Card, sign: int):
+        if card.rank == Rank.ACE:
+            self.hard_value += sign
+            self.num_aces += sign
+        else:
+            self.hard_value += sign * card.value
 
     def add_card(self, card: Card):
         """Adds a card to the hand."""
         self.cards.append(card)
+        self._count(card, 1)
+
+    def pop_card(self, index: int = -1) -> Card:
+        """Removes and returns a card (used when splitting)."""
+        card = self.cards.pop(index)
+        self._count(card, -1)
+        return card
+
+    @property
+    def is_soft(self) -> bool:
+        """True if an Ace is currently being counted as 11."""
+        return self.num_aces > 0 and self.hard_value + 10 <= 21
 
     @property
     def value(self) -> int:
         """
-        Calculates the total value of the hand, handling Aces (1 or 11)
-        dynamically.
+        The best total of the hand. At most one Ace can count as 11,
+        so this is the hard total plus 10 when the hand is soft.
         """
-        total = 0
-        num_aces = 0
-
-        for card in self.cards:
-            total += card.value
-            if card.rank == "A":  # Check against the Enum value
-                num_aces += 1
-
-        # Adjust for Aces
-        # While the total is over 21 and we have Aces,
-        # convert Ace value from 11 to 1
-        while total > 21 and num_aces > 0:
-            total -= 10
-            num_aces -= 1
-
-        return total
+        if self.num_aces and self.hard_value <= 11:
+            return self.hard_value + 10
+        return self.hard_value
 
     @property
     def is_bust(self) -> bool:
         """Checks if the hand value is over 21."""
-        return self.value > 21
+        return self.hard_value > 21
 
     @property
     def is_blackjack(self) -> bool:
         """Checks for a natural Blackjack (2 cards totaling 21)."""
-        return len(self.cards) == 2 and self.value == 21
+        return len(self.cards) == 2 and self.num_aces == 1 and self.hard_value == 11
 
     @property
     def can_split(self) -> bool:
@@ -77,6 +91,8 @@ class Hand:
         self.cards = []
         self.is_split = False
         self.bet = 0
+        self.hard_value = 0
+        self.num_aces = 0
 
     def __str__(self) -> str:
         """String representation of the hand."""
@@ -0,0 +1,23 @@
+"""
+Seeding helpers for reproducible, independent random streams.
+
+Every Shoe and Deck takes its own random.Random instead of sharing the
+global `random` module. Child seeds are derived from a root seed and a
+path of indices (e.g. worker, shard) by hashing, so sibling streams are
+statistically independent and any one of them can be replayed alone.
+"""
+
+import hashlib
+import random
+from typing import Optional
+
+
+def derive_seed(seed: int, *path: int) -> int:
+    """A 128-bit child seed for `path` under the root `seed`."""
+    key = ":".join(str(part) for part in (seed, *path))
+    return int.from_bytes(hashlib.sha256(key.encode()).digest()[:16], "big")
+
+
+def make_rng(seed: Optional[int] = None) -> random.Random:
+    """A private generator; unseeded generators draw from OS entropy."""
+    return random.Random(seed)
@@ -38,25 +38,8 @@ def should_dealer_hit(dealer_hand: Hand, rules: GameRules) -> bool:
         return False
 
     # The value is exactly 17. Now we check for "soft" 17.
-    # A hand is "soft" if an Ace is being counted as 11.
-    # We can check this by seeing if the "hard" value (all Aces=1)
-    # is different from the "soft" value (calculated by hand.value)
-
-    hard_value = 0
-    for card in dealer_hand.cards:
-        hard_value += 1 if card.rank == "A" else card.value
-
-    # Example: A-6
-    # hard_value = 1 + 6 = 7
-    # dealer_value = 17
-    # 7 != 17, so it's a soft hand.
-
-    # Example: 10-7
-    # hard_value = 10 + 7 = 17
-    # dealer_value = 17
-    # 17 == 17, so it's a hard hand.
-
-    is_soft = hard_value != dealer_value
+    # A hand is "soft" if an Ace is being counted as 11 (e.g. A-6).
+    is_soft = dealer_hand.is_soft
 
     if is_soft and rules.dealer_hits_on_soft_17:
         return True
@@ -0,0 +1,58 @@
+"""
+A buffered pool of pre-shuffled shoes.
+
+Shuffling a 312-card shoe one element at a time in Python is the most
+expensive part of a reshuffle. ShufflePool generates many shoe orders
+at once as a single vectorized NumPy permutation and hands them out in
+O(1); it refills in bulk whenever it runs low.
+"""
+
+from collections import deque
+
+import numpy as np
+
+from src.game.deck import NUM_CARDS
+
+
+class ShufflePool:
+    """
+    Pre-generates shuffled shoes (as bytearrays of card codes).
+
+    size: number of shoes generated per refill.
+    refill_threshold: refill as soon as this many or fewer are left.
+    seed: anything numpy.random.default_rng accepts, for reproducibility.
+    """
+
+    def __init__(
+        self,
+        num_decks: int = 6,
+        size: int = 64,
+        refill_threshold: int = 0,
+        seed=None,
+    ):
+        if size < 1 or not 0 <= refill_threshold < size:
+            raise ValueError("Need size >= 1 and 0 <= refill_threshold < size.")
+        self.num_decks = num_decks
+        self.size = size
+        self.refill_threshold = refill_threshold
+        self._rng = np.random.default_rng(seed)
+        self._base = np.tile(np.arange(NUM_CARDS, dtype=np.uint8), (size, num_decks))
+        self._shoes: deque[bytearray] = deque()
+        self.refill()
+
+    def refill(self):
+        """Tops the pool back up to `size` shoes in one vectorized pass."""
+        missing = self.size - len(self._shoes)
+        if missing <= 0:
+            return
+        block = self._rng.permuted(self._base[:missing], axis=1)
+        self._shoes.extend(bytearray(row) for row in block)
+
+    def next_shoe(self) -> bytearray:
+        """Returns the next shuffled shoe."""
+        if len(self._shoes) <= self.refill_threshold:
+            self.refill()
+        return self._shoes.popleft()
+
+    def __len__(self) -> int:
+        return len(self._shoes)
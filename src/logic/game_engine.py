@@ -1,39 +1,41 @@
 """
-The core GameEngine, built on PySide6's QObject.
-It manages the game state and flow, emitting signals
-for the UI to react to.
+The Qt GameEngine, built on PySide6's QObject.
+It is a thin adapter over the headless RoundEngine: it forwards
+player actions, turns engine events into signals for the UI,
+plays sounds and persists stats.
+
+The database (and SQLModel, which is slow to import) and the audio
+mixer can be started after the window is on screen: pass
+defer_services=True and call start_services() later, or
+open_storage(background=True) to load the stats off the UI thread.
 """
 
+import threading
+import time
+import uuid
 from PySide6.QtCore import QObject, Signal
-from src.game.deck import Shoe, Rank
+from src.game.counting import CountTracker
+from src.game.deck import Shoe
 from src.game.player import Player, Dealer
-from src.game.hand import Hand
-from src.game.rules import GameRules, get_hand_result
-from src.logic.ai_dealer import play_dealer_turn
-from src.audio.sound_manager import SoundManager
-from typing import Optional
+from src.game.rules import GameRules
+from src.logic import round_engine
+from src.logic.game_state import GameState
+from src.logic.round_engine import RoundEngine, RoundOutcome
+from src.audio.sound_manager import NullSoundManager, SoundManager
+from src.analysis.ev_oracle import ActionValues, engine_action_values
+from src.utils.constants import DEFAULT_PLAYER_ID, DEFAULT_TABLE_ID
+from typing import TYPE_CHECKING, Optional
 
-# --- NEW IMPORTS ---
-from src.data.database import load_stats, save_stats, create_db_and_tables
-from src.data.models import PlayerStats
-# --- END NEW IMPORTS ---
-
-
-class GameState:
-    """A simple class to hold the current game state for signals."""
-
-    def __init__(self, player: Player, dealer: Dealer, active_hand_index: int):
-        self.player = player
-        self.dealer = dealer
-        self.active_hand_index = active_hand_index
-        self.player_balance = player.balance
-        self.total_bet = player.total_bet
+if TYPE_CHECKING:
+    from src.data.models import PlayerStats, SessionStats
+    from src.data.persistence import PersistenceWorker
 
 
 class GameEngine(QObject):
     """
-    Manages the Blackjack game logic and state.
-    Inherits from QObject to use signals and slots.
+    Manages the Blackjack game for the UI.
+    Inherits from QObject to use signals and slots; the game
+    logic itself lives in RoundEngine.
     """
 
     # --- Signals ---
@@ -46,211 +48,252 @@ class GameEngine(QObject):
     show_message = Signal(str)
     player_split_successful = Signal(GameState)
     offer_insurance = Signal(GameState)
-
-    def __init__(self):
+    stats_loaded = Signal(int)                 # balance; the player can bet now
+    _storage_loaded = Signal(object)           # From the open_storage thread
+
+    def __init__(
+        self,
+        player_id: str = DEFAULT_PLAYER_ID,
+        table_id: str = DEFAULT_TABLE_ID,
+        sound_manager=None,
+        defer_services: bool = False,
+        num_seats: int = 1,
+    ):
         super().__init__()
+        self.player_id = player_id
+        self.table_id = table_id
+        # Seat 1 is `player_id`; other seats get their own stats rows
+        self.seat_player_ids = [player_id] + [
+            f"{player_id}-seat{i + 1}" for i in range(1, num_seats)
+        ]
+
+        # Filled in by open_storage(); `stats` and `session_stats` are seat 1's
+        self.stats: Optional["PlayerStats"] = None
+        self.session_stats: Optional["SessionStats"] = None
+        self.seat_stats: list["PlayerStats"] = []
+        self.seat_sessions: list["SessionStats"] = []
+        self.persistence: Optional["PersistenceWorker"] = None
+        self.storage_seconds = 0.0  # How long opening the database took
+        self._opening = False
+        # Queued to this (UI) thread when emitted by the loader thread
+        self._storage_loaded.connect(self._apply_storage)
+
+        # Silent until start_audio(); pass NullSoundManager() to stay silent
+        self._sound_manager = sound_manager
+        self.sound_manager = NullSoundManager()
+
+        # Running counts of every card dealt from the shoe
+        self.counter = CountTracker()  # The shoe sets its deck count
+
+        # The balance is set once the stats are loaded
+        self.core = RoundEngine(
+            shoe=Shoe(num_decks=6, counter=self.counter),
+            players=[Player(balance=0) for _ in range(num_seats)],
+            dealer=Dealer(),
+            rules=GameRules(),
+            listener=self._on_engine_event,
+        )
 
-        # --- NEW DATABASE LOGIC ---
-        # 1. Ensure database and tables exist
-        create_db_and_tables()
-        # 2. Load stats from DB
-        self.stats: PlayerStats = load_stats()
-        # --- END NEW LOGIC ---
-
-        self.sound_manager = SoundManager()
+        # Engine events that are forwarded as GameState signals
+        self._state_signals = {
+            round_engine.ROUND_STARTED: self.round_started,
+            round_engine.CARD_DEALT: self.card_dealt,
+            round_engine.DEALER_FINISHED: self.dealer_finished,
+            round_engine.NEXT_HAND_TURN: self.next_hand_turn,
+            round_engine.PLAYER_SPLIT: self.player_split_successful,
+            round_engine.OFFER_INSURANCE: self.offer_insurance,
+        }
 
-        self.shoe = Shoe(num_decks=6)
-        
-        # 3. Initialize player with loaded balance
-        self.player = Player(balance=self.stats.balance)
-        
-        self.dealer = Dealer()
-        self.rules = GameRules()
+        if not defer_services:
+            self.start_services()
 
-        self.current_bet = 0
-        self.active_hand_index = 0
-        self.insurance_is_offered = False
+    # --- Services ---
 
-    def get_game_state(self) -> GameState:
-        return GameState(
-            player=self.player,
-            dealer=self.dealer,
-            active_hand_index=self.active_hand_index,
-        )
+    @property
+    def is_ready(self) -> bool:
+        """True once the stats are loaded and rounds can be played."""
+        return self.stats is not None
 
-    # --- Game Flow Methods ---
+    def start_services(self):
+        self.open_storage()
+        self.start_audio()
 
-    def start_round(self, bet: int):
-        self.player.clear_hands()
-        self.dealer.clear_hand()
-        self.active_hand_index = 0
-        self.current_bet = bet
-        self.insurance_is_offered = False
-
-        if not self.player.place_bet(bet):
-            self.sound_manager.play("lose")
-            self.show_message.emit("Not enough balance to bet!")
+    def open_storage(self, background: bool = False):
+        """
+        Creates the tables, loads the stats and starts the writer thread.
+        With `background`, the database work runs on a one-shot thread
+        and stats_loaded is emitted on the UI thread once it is done.
+        """
+        if self.is_ready or self._opening:
+            return
+        if not background:
+            self._apply_storage(self._load_storage())
             return
 
-        self.sound_manager.play("chip")
-
-        # Initial deal
-        self.player.hands[0].add_card(self.shoe.deal())
-        self.dealer.hand.add_card(self.shoe.deal())
-        self.player.hands[0].add_card(self.shoe.deal())
-        self.dealer.hand.add_card(self.shoe.deal())
-        self.sound_manager.play("deal")
-
-        self.round_started.emit(self.get_game_state())
+        self._opening = True
+
+        def load():
+            try:
+                loaded = self._load_storage()
+            except Exception as e:
+                print(f"Error opening the database: {e}")
+                loaded = None
+            self._storage_loaded.emit(loaded)
+
+        threading.Thread(target=load, name="open-storage", daemon=True).start()
+
+    def _load_storage(self):
+        """
+        The database work of open_storage(). Returns (seat stats, seat
+        sessions, writer) without touching the players or the round.
+        """
+        started = time.perf_counter()
+        # Deferred: SQLModel/SQLAlchemy are slow to import
+        from src.data.database import create_db_and_tables, load_many_stats
+        from src.data.models import SessionStats
+        from src.data.persistence import PersistenceWorker
 
-        # Insurance?
-        if self.dealer.visible_card and self.dealer.visible_card.rank == Rank.ACE:
-            self.insurance_is_offered = True
-            self.offer_insurance.emit(self.get_game_state())
-            return
+        # --- NEW DATABASE LOGIC ---
+        # 1. Ensure database and tables exist
+        create_db_and_tables()
+        # 2. Load stats from DB (one query for every seat)
+        keys = [(player_id, self.table_id) for player_id in self.seat_player_ids]
+        loaded = load_many_stats(keys)
+        seat_stats = [loaded[key] for key in keys]
+        # 3. Aggregates for this run of the app
+        seat_sessions = [
+            SessionStats(
+                session_id=uuid.uuid4().hex,
+                player_id=stats.player_id,
+                table_id=stats.table_id,
+            )
+            for stats in seat_stats
+        ]
+        # 4. Rounds and stats are written on a background thread
+        persistence = PersistenceWorker()
+        # --- END NEW LOGIC ---
+        self.storage_seconds = time.perf_counter() - started
+        return seat_stats, seat_sessions, persistence
+
+    def _apply_storage(self, loaded):
+        self._opening = False
+        if loaded is None:
+            return  # The error was printed by the loader thread
+        self.seat_stats, self.seat_sessions, self.persistence = loaded
+        for player, stats in zip(self.players, self.seat_stats):
+            player.balance = stats.balance
+        self.session_stats = self.seat_sessions[0]
+        self.stats = self.seat_stats[0]  # Last: this makes is_ready true
+        self.stats_loaded.emit(self.players[0].balance)
+
+    def start_audio(self):
+        """Starts the mixer in the background (returns immediately)."""
+        if isinstance(self.sound_manager, NullSoundManager):
+            self.sound_manager = (
+                self._sound_manager if self._sound_manager is not None else SoundManager()
+            )
+
+    # --- Core state (read by the UI) ---
+
+    @property
+    def shoe(self) -> Shoe:
+        return self.core.shoe
+
+    @property
+    def player(self) -> Player:
+        """The player of the active seat."""
+        return self.core.player
+
+    @property
+    def players(self) -> list[Player]:
+        return self.core.players
+
+    @property
+    def active_seat(self) -> int:
+        return self.core.active_seat
+
+    @property
+    def dealer(self) -> Dealer:
+        return self.core.dealer
+
+    @property
+    def rules(self) -> GameRules:
+        return self.core.rules
+
+    @property
+    def active_hand_index(self) -> int:
+        return self.core.active_hand_index
+
+    @property
+    def insurance_is_offered(self) -> bool:
+        return self.core.insurance_is_offered
 
-        # Check Blackjacks
-        player_has_bj = self.player.hands[0].is_blackjack
-        dealer_has_bj = self.dealer.hand.is_blackjack
+    def get_game_state(self) -> GameState:
+        """A fresh immutable snapshot of the table."""
+        return GameState.from_engine(self.core)
 
-        if player_has_bj or dealer_has_bj:
-            self._end_round()
-        else:
-            self.show_message.emit("Your turn. Hit or Stand?")
+    def get_action_values(self) -> Optional[ActionValues]:
+        """Expected value of each action for the active hand (for hints)."""
+        return engine_action_values(self.core)
 
-    def _handle_insurance_result(self):
-        self.insurance_is_offered = False
-        player_has_bj = self.player.hands[0].is_blackjack
-        dealer_has_bj = self.dealer.hand.is_blackjack
+    def get_counts(self) -> dict[str, tuple[int, float]]:
+        """
+        (running, true) count per counting system, as the player sees the
+        table: the dealer's hole card is left out while it is face down.
+        """
+        hidden = (self.dealer.hidden_card.code,) if self.core.hole_hidden else ()
+        return self.counter.counts(hidden)
 
-        if player_has_bj or dealer_has_bj:
-            self._end_round()
-        else:
-            self.show_message.emit("Your turn. Hit or Stand?")
-            self.round_started.emit(self.get_game_state())
+    # --- Game Flow Methods ---
 
-    def player_accept_insurance(self):
-        insurance_cost = int(self.player.hands[0].bet / 2)
-        if self.player.balance < insurance_cost:
-            self.sound_manager.play("lose")
-            self.show_message.emit("Not enough balance for insurance!")
-            self.player_decline_insurance()
+    def start_round(self, bet: int):
+        if not self.is_ready:
+            # Deferred services: no stats to play against until open_storage()
+            self.show_message.emit("Still loading, please wait...")
             return
+        self.core.deal(bet)
 
-        self.player.balance -= insurance_cost
-        self.player.insurance = insurance_cost
-        self.sound_manager.play("chip")
-        self._handle_insurance_result()
+    def player_accept_insurance(self):
+        self.core.insurance(True)
 
     def player_decline_insurance(self):
-        self.player.insurance = 0
-        self._handle_insurance_result()
+        self.core.insurance(False)
 
     def player_hit(self):
-        if self.active_hand_index >= len(self.player.hands):
-            return
-
-        hand = self.player.hands[self.active_hand_index]
-        hand.add_card(self.shoe.deal())
-        self.sound_manager.play("deal")
-        self.card_dealt.emit(self.get_game_state())
-
-        if hand.is_bust:
-            self.sound_manager.play("bust")
-            self.show_message.emit("Bust!")
-            self._move_to_next_hand_or_dealer()
-        elif hand.value == 21:
-            self._move_to_next_hand_or_dealer()
+        self.core.hit()
 
     def player_stand(self):
-        if self.active_hand_index >= len(self.player.hands):
-            return
-        self._move_to_next_hand_or_dealer()
+        self.core.stand()
 
     def player_double_down(self):
-        if self.active_hand_index >= len(self.player.hands):
-            return
-
-        hand = self.player.hands[self.active_hand_index]
-        if not hand.can_double_down:
-            self.show_message.emit("Can only double down on 9, 10, or 11!")
-            return
-
-        if not self.player.place_bet(hand.bet):
-            self.sound_manager.play("lose")
-            self.show_message.emit("Not enough balance to double down!")
-            return
-
-        hand.bet *= 2
-        self.sound_manager.play("chip")
-        hand.add_card(self.shoe.deal())
-        self.sound_manager.play("deal")
-        self.card_dealt.emit(self.get_game_state())
-
-        if hand.is_bust:
-            self.sound_manager.play("bust")
-            self.show_message.emit(f"Bust on double! Lost {hand.bet}.")
-        self._move_to_next_hand_or_dealer()
+        self.core.double()
 
     def player_split(self):
-        if self.active_hand_index >= len(self.player.hands):
-            return
-
-        hand_to_split = self.player.hands[self.active_hand_index]
-        if not hand_to_split.can_split:
-            self.show_message.emit("Can only split two cards of the same rank!")
-            return
-
-        if len(self.player.hands) >= self.rules.max_splits + 1:
-            self.show_message.emit(f"Cannot have more than {self.rules.max_splits + 1} hands.")
-            return
-
-        if not self.player.place_bet(hand_to_split.bet):
-            self.sound_manager.play("lose")
-            self.show_message.emit("Not enough balance to split!")
-            return
-
-        self.sound_manager.play("chip")
-        new_hand = Hand(bet=hand_to_split.bet, is_split=True)
-        new_hand.add_card(hand_to_split.cards.pop(1))
-        self.player.hands.insert(self.active_hand_index + 1, new_hand)
-
-        hand_to_split.add_card(self.shoe.deal())
-        new_hand.add_card(self.shoe.deal())
-        self.sound_manager.play("deal")
-
-        self.player_split_successful.emit(self.get_game_state())
-
-        if hand_to_split.is_blackjack:
-            self._move_to_next_hand_or_dealer()
-
-    def _move_to_next_hand_or_dealer(self):
-        if self.active_hand_index < len(self.player.hands) - 1:
-            self.active_hand_index += 1
-            self.show_message.emit(f"Now playing Hand {self.active_hand_index + 1}")
-            self.next_hand_turn.emit(self.get_game_state())
-        else:
-            self._start_dealer_turn()
-
-    def _start_dealer_turn(self):
-        all_busted = all(hand.is_bust for hand in self.player.hands)
-        if all_busted:
-            self.show_message.emit("All player hands busted.")
-            self._end_round()
-            return
-
-        # Dealer draws all cards
-        dealer_ai = play_dealer_turn(self.dealer, self.shoe, self.rules)
-        for card in dealer_ai:
-            if card:
-                self.dealer.hand.add_card(card)
-                self.card_dealt.emit(self.get_game_state())
-            else:
-                break
-
-        # Dealer done → reveal hole card + end round
-        self.dealer_finished.emit(self.get_game_state())
-        self._end_round()
+        self.core.split()
+
+    def apply_action(self, action: str) -> bool:
+        """Applies an action by name, e.g. one chosen by a bot."""
+        return self.core.apply(action)
+
+    def shutdown(self):
+        """Writes any queued history and stats. Call before exiting."""
+        if self.persistence is not None:
+            self.persistence.close()
+        self.sound_manager.close()
+
+    # --- Engine events ---
+
+    def _on_engine_event(self, event: str, *args):
+        signal = self._state_signals.get(event)
+        if signal is not None:
+            # One snapshot per state change, shared by every receiver
+            signal.emit(GameState.from_engine(self.core))
+        elif event == round_engine.SOUND:
+            self.sound_manager.play(args[0])
+        elif event == round_engine.MESSAGE:
+            self.show_message.emit(args[0])
+        elif event == round_engine.ROUND_OVER:
+            self._end_round(args[0])
 
     def _translate_result_to_friendly_text(self, result_str: str) -> str:
         translations = {
@@ -264,66 +307,76 @@ class GameEngine(QObject):
         }
         return translations.get(result_str, result_str.replace("_", " ").title())
 
-    def _end_round(self):
-        total_payout = 0
+    def _seat_summary(self, player: Player, outcome: RoundOutcome) -> tuple[str, str]:
+        """(simple, detailed) summary of one seat's round."""
         detailed_summary = ""
-        final_player_win_status = 0  # 0=push, 1=win, -1=lose
-
-        current_insurance_bet = self.player.insurance
-        if current_insurance_bet > 0:
-            if self.dealer.hand.is_blackjack:
-                insurance_payout = int(current_insurance_bet * self.rules.insurance_payout)
-                total_payout += current_insurance_bet + insurance_payout
-                self.player.balance += current_insurance_bet + insurance_payout
-                detailed_summary += f"INSURANCE WIN: +${insurance_payout}\n"
-            else:
-                detailed_summary += f"INSURANCE LOSE: -${current_insurance_bet}\n"
-            self.player.insurance = 0
 
-        for i, hand in enumerate(self.player.hands):
-            result_str, payout = get_hand_result(hand, self.dealer.hand, self.rules)
-            total_payout += payout
-            self.player.balance += payout
-
-            if payout > hand.bet:
-                final_player_win_status = 1
-            elif payout == 0 and final_player_win_status != 1:
-                final_player_win_status = -1
+        if outcome.insurance_bet > 0:
+            if outcome.insurance_payout > 0:
+                detailed_summary += f"INSURANCE WIN: +${outcome.insurance_payout}\n"
+            else:
+                detailed_summary += f"INSURANCE LOSE: -${outcome.insurance_bet}\n"
 
+        for i, (hand, (result_str, payout)) in enumerate(
+            zip(player.hands, outcome.results)
+        ):
             friendly_text = self._translate_result_to_friendly_text(result_str)
             hand_prefix = f"Hand {i + 1} ({hand.value})"
             detailed_summary += f"{hand_prefix}: {friendly_text} (Bet: ${hand.bet}, Won: ${payout})\n"
 
         # Simple summary
-        if final_player_win_status == 1:
+        if outcome.win_status == 1:
             simple_summary = "You Won!"
-        elif final_player_win_status == -1:
+        elif outcome.win_status == -1:
             simple_summary = "You Lost"
         else:
             simple_summary = "Push (It's a Tie)"
 
-        if len(self.player.hands) == 1 and self.player.hands[0].is_blackjack:
+        if len(player.hands) == 1 and player.hands[0].is_blackjack:
             simple_summary = "Blackjack!"
+        return simple_summary, detailed_summary
+
+    def _record_seat(self, seat: int, player: Player, outcome: RoundOutcome):
+        # (already imported by open_storage, so this is a dict lookup)
+        from src.data.history import history_entry, record_outcome
+
+        stats, session_stats = self.seat_stats[seat], self.seat_sessions[seat]
+        record_outcome(stats, session_stats, outcome, player.balance)
+        entry = history_entry(
+            self.core,
+            outcome,
+            player_id=stats.player_id,
+            table_id=stats.table_id,
+            session_id=session_stats.session_id,
+            seat=seat,
+        )
+        self.persistence.submit(entry, stats, session_stats)
+
+    def _end_round(self, outcomes: list[Optional[RoundOutcome]]):
+        simple_parts, detailed_summary, total_payout = [], "", 0
+        multi_seat = len(outcomes) > 1
+        for seat, (player, outcome) in enumerate(zip(self.players, outcomes)):
+            if outcome is None:
+                continue  # Sat out
+            simple, detailed = self._seat_summary(player, outcome)
+            if multi_seat:
+                simple_parts.append(f"Seat {seat + 1}: {simple}")
+                detailed_summary += f"Seat {seat + 1}\n{detailed}"
+            else:
+                simple_parts.append(simple)
+                detailed_summary += detailed
+            total_payout += outcome.total_payout
 
-        # Sound
-        if final_player_win_status == 1:
-            self.sound_manager.play("win")
-        elif final_player_win_status == -1:
-            self.sound_manager.play("lose")
-
-        # --- NEW DATABASE LOGIC ---
-        # Update and save stats
-        if final_player_win_status == 1:
-            self.stats.total_wins += 1
-        elif final_player_win_status == -1:
-            self.stats.total_losses += 1
-        
-        self.stats.balance = self.player.balance
-        save_stats(self.stats)
-        # --- END NEW LOGIC ---
+            # --- NEW DATABASE LOGIC ---
+            # Update stats and hand the round to the writer thread
+            # (skipped for a round driven on the core before open_storage)
+            if self.is_ready:
+                self._record_seat(seat, player, outcome)
+            # --- END NEW LOGIC ---
 
         if not detailed_summary.strip():
             detailed_summary = "Round over."
 
-        self.round_over.emit(simple_summary, detailed_summary, total_payout, self.player.balance)
-        self.active_hand_index = 0
\ No newline at end of file
+        self.round_over.emit(
+            "  ".join(simple_parts), detailed_summary, total_payout, self.players[0].balance
+        )
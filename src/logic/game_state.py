@@ -0,0 +1,156 @@
+"""
+GameState, the view of a round handed to the UI and to bots.
+
+A GameState is an immutable snapshot of every seat and the dealer:
+hands are tuples of card codes (see src.game.deck) plus the totals the
+UI shows, with no references to the live Player, Dealer or Hand
+objects. One snapshot is built per state change and shared by every
+receiver, so it can be queued, kept in a replay buffer, or pickled to
+another thread, process or machine without copying. While the hole
+card is face down the snapshot does not contain it: its code is
+HIDDEN_CARD and the dealer's totals are the upcard's. They are
+NamedTuples rather than frozen dataclasses because building one is
+several times cheaper. Kept free of Qt so headless code can build one
+too.
+"""
+
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+from src.game.deck import Rank
+from src.game.hand import Hand
+from src.game.player import Dealer, Player
+
+if TYPE_CHECKING:
+    from src.logic.round_engine import RoundEngine
+
+# Stands in for the dealer's face-down hole card in HandState.cards.
+HIDDEN_CARD = -1
+
+
+class HandState(NamedTuple):
+    """One hand at the moment of the snapshot."""
+
+    cards: tuple[int, ...]  # Card codes, in the order dealt
+    bet: int
+    value: int
+    is_soft: bool
+    is_bust: bool
+    is_blackjack: bool
+    can_split: bool
+    can_double_down: bool
+    is_split: bool
+
+    @classmethod
+    def from_hand(cls, hand: Hand) -> "HandState":
+        # Positional: keyword arguments make NamedTuple construction slower
+        return cls(
+            tuple([card.code for card in hand.cards]),
+            hand.bet,
+            hand.value,
+            hand.is_soft,
+            hand.is_bust,
+            hand.is_blackjack,
+            hand.can_split,
+            hand.can_double_down,
+            hand.is_split,
+        )
+
+    @classmethod
+    def from_dealer(cls, dealer: Dealer, hole_hidden: bool) -> "HandState":
+        """The dealer's hand, with the hole card masked while `hole_hidden`."""
+        if not hole_hidden:
+            return cls.from_hand(dealer.hand)
+        cards = dealer.hand.cards
+        upcard = dealer.visible_card
+        return cls(
+            (HIDDEN_CARD,) + tuple([card.code for card in cards[1:]]),
+            0,
+            dealer.visible_value,
+            upcard is not None and upcard.rank == Rank.ACE,
+            False,
+            False,
+            False,
+            False,
+            False,
+        )
+
+
+class SeatState(NamedTuple):
+    """One seat (player) at the moment of the snapshot."""
+
+    hands: tuple[HandState, ...]
+    balance: int
+    total_bet: int  # Including split hands and insurance
+    insurance: int
+    seated: bool  # Playing this round
+
+    @classmethod
+    def from_player(cls, player: Player, seated: bool) -> "SeatState":
+        return cls(
+            tuple([HandState.from_hand(hand) for hand in player.hands]),
+            player.balance,
+            player.total_bet,
+            player.insurance,
+            seated,
+        )
+
+
+class GameState(NamedTuple):
+    """
+    The table at one moment of a round. `hands`, `player_balance`,
+    `total_bet` and `insurance` describe the active seat.
+    """
+
+    seats: tuple[SeatState, ...]
+    active_seat: int
+    active_hand_index: int
+    dealer: HandState  # Hole card first, then the upcard and any draws
+    dealer_visible_value: int  # The upcard's value, for while the hole is hidden
+    hole_hidden: bool  # dealer.cards[0] is HIDDEN_CARD
+    insurance_offered: bool
+    in_progress: bool
+
+    @classmethod
+    def from_engine(cls, engine: "RoundEngine") -> "GameState":
+        dealer = engine.dealer
+        hole_hidden = engine.hole_hidden
+        return cls(
+            tuple([
+                SeatState.from_player(player, seated)
+                for player, seated in zip(engine.players, engine.seated)
+            ]),
+            engine.active_seat,
+            engine.active_hand_index,
+            HandState.from_dealer(dealer, hole_hidden),
+            dealer.visible_value,
+            hole_hidden,
+            engine.insurance_is_offered,
+            engine.in_progress,
+        )
+
+    @property
+    def seat(self) -> SeatState:
+        return self.seats[self.active_seat]
+
+    @property
+    def hands(self) -> tuple[HandState, ...]:
+        return self.seats[self.active_seat].hands
+
+    @property
+    def player_balance(self) -> int:
+        return self.seats[self.active_seat].balance
+
+    @property
+    def total_bet(self) -> int:
+        return self.seats[self.active_seat].total_bet
+
+    @property
+    def insurance(self) -> int:
+        return self.seats[self.active_seat].insurance
+
+    @property
+    def active_hand(self) -> Optional[HandState]:
+        hands = self.seats[self.active_seat].hands
+        if self.active_hand_index < len(hands):
+            return hands[self.active_hand_index]
+        return None
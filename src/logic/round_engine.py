@@ -0,0 +1,457 @@
+"""
+A headless, Qt-free round engine.
+
+RoundEngine owns the shoe, the players (one per seat, up to seven),
+the dealer and the rules, and plays rounds through a small step API
+(deal, hit, stand, double, split, insurance). Seats act in turn: every
+step applies to the active seat, and the dealer plays once after the
+last seat. A table of N seats is one engine, not N.
+Instead of Qt signals it reports events through a plain callback, so
+servers and simulators can play rounds without importing PySide6,
+pygame or the database layer. GameEngine is a thin Qt adapter over it.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence, Union
+
+from src.game.deck import Rank, Shoe
+from src.game.hand import Hand
+from src.game.player import Dealer, Player
+from src.game.rules import GameRules, get_hand_result
+from src.logic.ai_dealer import play_dealer_turn
+
+# --- Event names ---
+# State events carry no payload; listeners read the engine directly.
+ROUND_STARTED = "round_started"
+CARD_DEALT = "card_dealt"
+DEALER_FINISHED = "dealer_finished"
+NEXT_HAND_TURN = "next_hand_turn"
+PLAYER_SPLIT = "player_split_successful"
+OFFER_INSURANCE = "offer_insurance"
+# Payload events.
+ROUND_OVER = "round_over"  # (outcomes,): a RoundOutcome per seat, None if it sat out
+MESSAGE = "show_message"  # (text,)
+SOUND = "sound"  # (sound_name,)
+
+# --- Actions ---
+# Names accepted by RoundEngine.apply; they match the entries of `actions`.
+HIT = "hit"
+STAND = "stand"
+DOUBLE = "double"
+SPLIT = "split"
+TAKE_INSURANCE = "insurance"
+DECLINE_INSURANCE = "no_insurance"
+
+EventListener = Callable[..., None]
+
+MAX_SEATS = 7
+
+
+@dataclass(slots=True)
+class RoundOutcome:
+    """The settled result of a single round."""
+
+    results: List[tuple[str, int]] = field(default_factory=list)  # per hand
+    insurance_bet: int = 0
+    insurance_payout: int = 0  # Insurance winnings, excluding the stake
+    total_payout: int = 0  # Everything returned to the player
+    total_bet: int = 0  # Everything the player put on the table
+    win_status: int = 0  # 0=push, 1=win, -1=lose
+
+    @property
+    def net(self) -> int:
+        """The player's profit (or loss) for the round."""
+        return self.total_payout - self.total_bet
+
+
+class RoundEngine:
+    """
+    Plays Blackjack rounds without any UI, audio or persistence.
+
+    Every step method returns True if the action was applied and
+    False if it was rejected (wrong phase, not allowed, no balance).
+    Pass `players` for a multi-seat table; `player` is the active seat.
+    """
+
+    def __init__(
+        self,
+        shoe: Optional[Shoe] = None,
+        player: Optional[Player] = None,
+        dealer: Optional[Dealer] = None,
+        rules: Optional[GameRules] = None,
+        listener: Optional[EventListener] = None,
+        players: Optional[Sequence[Player]] = None,
+    ):
+        if players is None:
+            players = [player if player is not None else Player()]
+        elif player is not None:
+            raise ValueError("Pass either player or players, not both.")
+        if not 1 <= len(players) <= MAX_SEATS:
+            raise ValueError(f"A table has 1 to {MAX_SEATS} seats.")
+
+        self.shoe = shoe if shoe is not None else Shoe(num_decks=6)
+        self.players: List[Player] = list(players)
+        self.dealer = dealer if dealer is not None else Dealer()
+        self.rules = rules if rules is not None else GameRules()
+        self.listener = listener
+
+        self.active_seat = 0
+        self.active_hand_index = 0
+        self.insurance_is_offered = False
+        self.in_progress = False
+        self.dealer_playing = False  # The dealer's turn has started
+        self.seated: List[bool] = [False] * len(self.players)  # Playing this round
+        self.last_outcomes: List[Optional[RoundOutcome]] = []
+        # Every applied action this round, per seat
+        self.seat_actions: List[List[str]] = [[] for _ in self.players]
+
+    def _emit(self, event: str, *args):
+        if self.listener is not None:
+            self.listener(event, *args)
+
+    @property
+    def player(self) -> Player:
+        """The player of the active seat."""
+        return self.players[self.active_seat]
+
+    @property
+    def actions(self) -> List[str]:
+        """The actions of the active seat this round."""
+        return self.seat_actions[self.active_seat]
+
+    @property
+    def hole_hidden(self) -> bool:
+        """True while the dealer's hole card is face down."""
+        return (
+            self.in_progress
+            and not self.dealer_playing
+            and self.dealer.hidden_card is not None
+        )
+
+    @property
+    def last_outcome(self) -> Optional[RoundOutcome]:
+        """The last settled outcome of the first seat."""
+        return self.last_outcomes[0] if self.last_outcomes else None
+
+    @property
+    def active_hand(self) -> Optional[Hand]:
+        """The hand currently being played, if any."""
+        if self.in_progress and self.active_hand_index < len(self.player.hands):
+            return self.player.hands[self.active_hand_index]
+        return None
+
+    # --- Step API ---
+
+    def deal(self, bet: Union[int, Sequence[int]]) -> bool:
+        """
+        Places the bets and deals the initial cards. `bet` is one stake
+        for every seat, or one per seat (0 sits the seat out).
+        """
+        players = self.players
+        bets = [bet] * len(players) if isinstance(bet, int) else list(bet)
+        if len(bets) != len(players):
+            raise ValueError("Need one bet per seat.")
+
+        self.shoe.reshuffle_if_due()  # Only between rounds, never mid-round
+        self.dealer.clear_hand()
+        self.active_seat = 0
+        self.active_hand_index = 0
+        self.insurance_is_offered = False
+        self.in_progress = False
+        self.dealer_playing = False
+        self.last_outcomes = []
+
+        seated = self.seated
+        for i, (player, stake) in enumerate(zip(players, bets)):
+            player.clear_hands()
+            self.seat_actions[i] = []
+            seated[i] = stake > 0 and player.place_bet(stake)
+            if stake > 0 and not seated[i] and len(players) > 1:
+                self._emit(MESSAGE, f"Seat {i + 1}: not enough balance to bet!")
+
+        if not any(seated):
+            self._emit(SOUND, "lose")
+            self._emit(MESSAGE, "Not enough balance to bet!")
+            return False
+
+        self.in_progress = True
+        for i in range(len(players)):
+            if seated[i]:
+                self.seat_actions[i].append("deal")
+        self._emit(SOUND, "chip")
+
+        # Initial deal: a card to every seat, the hole card, then again
+        shoe = self.shoe
+        hands = [player.hands[0] for player, sits in zip(players, seated) if sits]
+        for hand in hands:
+            hand.add_card(shoe.deal())
+        self.dealer.hand.add_card(shoe.deal())
+        for hand in hands:
+            hand.add_card(shoe.deal())
+        self.dealer.hand.add_card(shoe.deal())
+        self._emit(SOUND, "deal")
+
+        self.active_seat = seated.index(True)
+        self._emit(ROUND_STARTED)
+
+        # Insurance? Offered to each seat in turn.
+        if self.dealer.visible_card and self.dealer.visible_card.rank == Rank.ACE:
+            self.insurance_is_offered = True
+            self._emit(OFFER_INSURANCE)
+            return True
+
+        self._start_play()
+        return True
+
+    def insurance(self, accept: bool) -> bool:
+        """Resolves the active seat's insurance offer by accepting or declining it."""
+        if not self.insurance_is_offered:
+            return False
+
+        if accept:
+            insurance_cost = int(self.player.hands[0].bet / 2)
+            if self.player.balance < insurance_cost:
+                self._emit(SOUND, "lose")
+                self._emit(MESSAGE, "Not enough balance for insurance!")
+                accept = False
+            else:
+                self.player.balance -= insurance_cost
+                self.player.insurance = insurance_cost
+                self._emit(SOUND, "chip")
+
+        if not accept:
+            self.player.insurance = 0
+
+        self.actions.append("insurance" if accept else "no_insurance")
+        next_seat = self._next_seat(self.active_seat, skip_naturals=False)
+        if next_seat is not None:
+            self.active_seat = next_seat
+            self._emit(OFFER_INSURANCE)
+            return True
+
+        self.insurance_is_offered = False
+        self.active_seat = self.seated.index(True)
+        self._start_play(after_insurance=True)
+        return True
+
+    def hit(self) -> bool:
+        """Deals one card to the active hand."""
+        hand = self.active_hand
+        if hand is None or self.insurance_is_offered:
+            return False
+
+        self.actions.append("hit")
+        hand.add_card(self.shoe.deal())
+        self._emit(SOUND, "deal")
+        self._emit(CARD_DEALT)
+
+        if hand.is_bust:
+            self._emit(SOUND, "bust")
+            self._emit(MESSAGE, "Bust!")
+            self._move_to_next_hand_or_dealer()
+        elif hand.value == 21:
+            self._move_to_next_hand_or_dealer()
+        return True
+
+    def stand(self) -> bool:
+        """Ends play on the active hand."""
+        if self.active_hand is None or self.insurance_is_offered:
+            return False
+        self.actions.append("stand")
+        self._move_to_next_hand_or_dealer()
+        return True
+
+    def double(self) -> bool:
+        """Doubles the bet on the active hand and deals exactly one card."""
+        hand = self.active_hand
+        if hand is None or self.insurance_is_offered:
+            return False
+
+        if not hand.can_double_down:
+            self._emit(MESSAGE, "Can only double down on 9, 10, or 11!")
+            return False
+
+        if not self.player.place_bet(hand.bet, self.active_hand_index):
+            self._emit(SOUND, "lose")
+            self._emit(MESSAGE, "Not enough balance to double down!")
+            return False
+
+        hand.bet *= 2
+        self.actions.append("double")
+        self._emit(SOUND, "chip")
+        hand.add_card(self.shoe.deal())
+        self._emit(SOUND, "deal")
+        self._emit(CARD_DEALT)
+
+        if hand.is_bust:
+            self._emit(SOUND, "bust")
+            self._emit(MESSAGE, f"Bust on double! Lost {hand.bet}.")
+        self._move_to_next_hand_or_dealer()
+        return True
+
+    def split(self) -> bool:
+        """Splits the active pair into two hands."""
+        hand_to_split = self.active_hand
+        if hand_to_split is None or self.insurance_is_offered:
+            return False
+
+        if not hand_to_split.can_split:
+            self._emit(MESSAGE, "Can only split two cards of the same rank!")
+            return False
+
+        if len(self.player.hands) >= self.rules.max_splits + 1:
+            self._emit(
+                MESSAGE, f"Cannot have more than {self.rules.max_splits + 1} hands."
+            )
+            return False
+
+        bet = hand_to_split.bet
+        if bet > self.player.balance:
+            self._emit(SOUND, "lose")
+            self._emit(MESSAGE, "Not enough balance to split!")
+            return False
+        self.player.balance -= bet
+        self.actions.append("split")
+
+        self._emit(SOUND, "chip")
+        new_hand = Hand(bet=bet, is_split=True)
+        new_hand.add_card(hand_to_split.pop_card(1))
+        self.player.hands.insert(self.active_hand_index + 1, new_hand)
+
+        hand_to_split.add_card(self.shoe.deal())
+        new_hand.add_card(self.shoe.deal())
+        self._emit(SOUND, "deal")
+
+        self._emit(PLAYER_SPLIT)
+
+        if hand_to_split.is_blackjack:
+            self._move_to_next_hand_or_dealer()
+        return True
+
+    def apply(self, action: str) -> bool:
+        """Applies an action by name (see the action constants above)."""
+        if action == HIT:
+            return self.hit()
+        if action == STAND:
+            return self.stand()
+        if action == DOUBLE:
+            return self.double()
+        if action == SPLIT:
+            return self.split()
+        if action == TAKE_INSURANCE:
+            return self.insurance(True)
+        if action == DECLINE_INSURANCE:
+            return self.insurance(False)
+        raise ValueError(f"Unknown action: {action!r}")
+
+    # --- Round flow ---
+
+    def _next_seat(self, seat: int, skip_naturals: bool = True) -> Optional[int]:
+        """The next seat after `seat` that still has to act, if any."""
+        for i in range(seat + 1, len(self.players)):
+            if self.seated[i] and not (skip_naturals and self.players[i].hands[0].is_blackjack):
+                return i
+        return None
+
+    def _start_play(self, after_insurance: bool = False):
+        """Hands the turn to the first seat that has to play, or settles."""
+        if self.dealer.hand.is_blackjack:
+            self._end_round()
+            return
+        first = self._next_seat(-1)
+        if first is None:
+            self._end_round()  # Every seat has a natural
+            return
+        self.active_seat = first
+        if len(self.players) > 1:
+            self._emit(MESSAGE, f"Seat {first + 1}: your turn. Hit or Stand?")
+        else:
+            self._emit(MESSAGE, "Your turn. Hit or Stand?")
+        if after_insurance:
+            self._emit(ROUND_STARTED)
+
+    def _move_to_next_hand_or_dealer(self):
+        if self.active_hand_index < len(self.player.hands) - 1:
+            self.active_hand_index += 1
+            self._emit(MESSAGE, f"Now playing Hand {self.active_hand_index + 1}")
+            self._emit(NEXT_HAND_TURN)
+            return
+
+        next_seat = self._next_seat(self.active_seat)
+        if next_seat is not None:
+            self.active_seat = next_seat
+            self.active_hand_index = 0
+            self._emit(MESSAGE, f"Seat {next_seat + 1}: your turn. Hit or Stand?")
+            self._emit(NEXT_HAND_TURN)
+        else:
+            self._play_dealer()
+
+    def _play_dealer(self):
+        self.dealer_playing = True
+        if all(
+            hand.is_bust
+            for player, sits in zip(self.players, self.seated) if sits
+            for hand in player.hands
+        ):
+            self._emit(MESSAGE, "All player hands busted.")
+            self._end_round()
+            return
+
+        # play_dealer_turn adds each card to the dealer's hand itself
+        for card in play_dealer_turn(self.dealer, self.shoe, self.rules):
+            if card is None:
+                break
+            self._emit(CARD_DEALT)
+
+        # Dealer done → reveal hole card + end round
+        self._emit(DEALER_FINISHED)
+        self._end_round()
+
+    def _end_round(self) -> List[Optional[RoundOutcome]]:
+        outcomes = [
+            self._settle(player) if sits else None
+            for player, sits in zip(self.players, self.seated)
+        ]
+
+        # Sound
+        statuses = [outcome.win_status for outcome in outcomes if outcome is not None]
+        if 1 in statuses:
+            self._emit(SOUND, "win")
+        elif -1 in statuses:
+            self._emit(SOUND, "lose")
+
+        self.in_progress = False
+        self.last_outcomes = outcomes
+        self._emit(ROUND_OVER, outcomes)
+        self.active_seat = 0
+        self.active_hand_index = 0
+        return outcomes
+
+    def _settle(self, player: Player) -> RoundOutcome:
+        """Pays out one seat's insurance and hands."""
+        outcome = RoundOutcome(total_bet=player.total_bet)
+        dealer_hand = self.dealer.hand
+
+        insurance_bet = player.insurance
+        if insurance_bet > 0:
+            outcome.insurance_bet = insurance_bet
+            if dealer_hand.is_blackjack:
+                insurance_payout = int(insurance_bet * self.rules.insurance_payout)
+                outcome.insurance_payout = insurance_payout
+                outcome.total_payout += insurance_bet + insurance_payout
+                player.balance += insurance_bet + insurance_payout
+            player.insurance = 0
+
+        win_status = 0
+        for hand in player.hands:
+            result_str, payout = get_hand_result(hand, dealer_hand, self.rules)
+            outcome.results.append((result_str, payout))
+            outcome.total_payout += payout
+            player.balance += payout
+
+            if payout > hand.bet:
+                win_status = 1
+            elif payout == 0 and win_status != 1:
+                win_status = -1
+        outcome.win_status = win_status
+        return outcome
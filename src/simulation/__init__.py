@@ -0,0 +1 @@
+# This file makes 'src.simulation' a Python package
@@ -0,0 +1,79 @@
+"""
+Command-line entry point for the Monte Carlo simulator.
+
+Usage:
+    python -m src.simulation --rounds 10000000 --workers 8
+"""
+
+import argparse
+
+from src.game.rules import GameRules
+from src.simulation.simulator import SimulationStats, simulate
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.simulation",
+        description="Estimate house edge and variance for a rule set.",
+    )
+    parser.add_argument("--rounds", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=None, help="Default: CPU count")
+    parser.add_argument("--shard-size", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--decks", type=int, default=6)
+    parser.add_argument("--bet", type=int, default=10)
+    parser.add_argument("--blackjack-payout", type=float, default=1.5)
+    parser.add_argument("--s17", action="store_true", help="Dealer stands on soft 17")
+    parser.add_argument("--max-splits", type=int, default=3)
+    parser.add_argument(
+        "--pool-size", type=int, default=64, help="Shoes pre-shuffled per refill"
+    )
+    parser.add_argument(
+        "--pool-refill", type=int, default=0, help="Refill when this many shoes remain"
+    )
+    return parser.parse_args()
+
+
+def print_progress(stats: SimulationStats, elapsed: float):
+    rate = stats.hands / elapsed if elapsed > 0 else 0.0
+    print(
+        f"{stats.rounds:>14,} rounds  {rate:>12,.0f} hands/s  "
+        f"EV {stats.ev:+.4%} ± {stats.std_error:.4%}"
+    )
+
+
+def main():
+    args = parse_args()
+    rules = GameRules(
+        blackjack_payout=args.blackjack_payout,
+        dealer_hits_on_soft_17=not args.s17,
+        max_splits=args.max_splits,
+    )
+    print(f"Simulating {args.rounds:,} rounds: {args.decks} decks, {rules}")
+
+    stats = simulate(
+        rules,
+        args.rounds,
+        num_decks=args.decks,
+        workers=args.workers,
+        shard_size=args.shard_size,
+        seed=args.seed,
+        bet=args.bet,
+        pool_size=args.pool_size,
+        pool_refill=args.pool_refill,
+        progress=print_progress,
+    )
+
+    print()
+    print(f"Rounds:        {stats.rounds:,}")
+    print(f"Hands:         {stats.hands:,}")
+    print(f"EV per round:  {stats.ev:+.4%} ± {stats.std_error:.4%}")
+    print(f"House edge:    {-stats.ev:.4%}")
+    print(f"Std deviation: {stats.std_dev:.4f} bets")
+    print("Outcomes:")
+    for result_str, count in stats.outcomes.most_common():
+        print(f"  {result_str:<16} {count:>14,}  {count / stats.hands:7.3%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Plays many bot seats in one process.
+
+Each seat is one strategy on its own RoundEngine and Shoe (with a
+running count), and all seats draw their shuffled shoes from one shared
+ShufflePool. Rounds are played seat by seat with no UI, audio or
+persistence, so thousands of seats fit in a single process.
+
+Usage:
+    python -m src.simulation.bot_runner --strategy basic --strategy i18 --seats 1000
+"""
+
+import argparse
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from src.game.counting import CountTracker
+from src.game.deck import Shoe
+from src.game.player import Player
+from src.game.rng import derive_seed, make_rng
+from src.game.rules import GameRules
+from src.game.shuffle_pool import ShufflePool
+from src.logic.round_engine import DECLINE_INSURANCE, STAND, RoundEngine
+from src.simulation.simulator import SIMULATION_BANKROLL, SimulationStats
+from src.simulation.strategies import (
+    BasicStrategyBot,
+    DecisionView,
+    Illustrious18Bot,
+    RandomBot,
+    Strategy,
+)
+
+
+@dataclass
+class Seat:
+    """One bot and the engine it plays on."""
+
+    index: int
+    strategy: Strategy
+    engine: RoundEngine
+    counter: CountTracker
+    stats: SimulationStats = field(default_factory=SimulationStats)
+    rejected: int = 0  # Actions the engine refused (replaced by stand)
+
+
+class BotRunner:
+    """Drives any number of bot seats through rounds."""
+
+    def __init__(
+        self,
+        rules: Optional[GameRules] = None,
+        num_decks: int = 6,
+        seed: int = 0,
+        bet: int = 10,
+        pool_size: int = 64,
+    ):
+        self.rules = rules if rules is not None else GameRules()
+        self.num_decks = num_decks
+        self.seed = seed
+        self.bet = bet
+        self.pool = ShufflePool(num_decks, pool_size, seed=derive_seed(seed, 0))
+        self.seats: list[Seat] = []
+
+    def add_seat(self, strategy: Strategy) -> Seat:
+        index = len(self.seats)
+        counter = CountTracker(num_decks=self.num_decks)
+        shoe = Shoe(
+            num_decks=self.num_decks,
+            verbose=False,
+            shuffle_pool=self.pool,
+            rng=make_rng(derive_seed(self.seed, 1, index)),
+            counter=counter,
+        )
+        engine = RoundEngine(
+            shoe=shoe, player=Player(balance=SIMULATION_BANKROLL), rules=self.rules
+        )
+        seat = Seat(index, strategy, engine, counter)
+        self.seats.append(seat)
+        return seat
+
+    def play_round(self, seat: Seat):
+        engine, strategy, stats = seat.engine, seat.strategy, seat.stats
+        engine.shoe.reshuffle_if_due()  # Bet on the count of the shoe being dealt
+        bet = strategy.bet(DecisionView(engine, seat.counter), self.bet)
+        engine.player.balance = SIMULATION_BANKROLL
+        engine.deal(bet)
+
+        while engine.in_progress:
+            action = strategy.decide(DecisionView(engine, seat.counter))
+            if not engine.apply(action):
+                seat.rejected += 1
+                engine.apply(DECLINE_INSURANCE if engine.insurance_is_offered else STAND)
+
+        outcome = engine.last_outcome
+        stats.add_round(outcome.net / self.bet)
+        stats.hands += len(outcome.results)
+        stats.total_wagered += bet
+        for result_str, _ in outcome.results:
+            stats.outcomes[result_str] += 1
+
+    def run(
+        self,
+        rounds: int,
+        progress: Optional[Callable[[int, float], None]] = None,
+        progress_every: int = 100,
+    ) -> SimulationStats:
+        """
+        Plays `rounds` rounds at every seat and returns the merged stats.
+        `progress(rounds done, elapsed seconds)` is called periodically.
+        """
+        start = time.perf_counter()
+        play_round = self.play_round
+        for done in range(1, rounds + 1):
+            for seat in self.seats:
+                play_round(seat)
+            if progress is not None and (done % progress_every == 0 or done == rounds):
+                progress(done, time.perf_counter() - start)
+        return self.totals()
+
+    def totals(self, name: Optional[str] = None) -> SimulationStats:
+        """Merged stats of every seat (or of the seats playing `name`)."""
+        total = SimulationStats()
+        for seat in self.seats:
+            if name is None or getattr(seat.strategy, "name", None) == name:
+                total.merge(seat.stats)
+        return total
+
+
+# --- Command line ---
+
+STRATEGIES = ("basic", "i18", "random")
+
+
+def make_strategy(name: str, rules: GameRules, num_decks: int, seed: int, bet_spread: int = 1):
+    if name == "basic":
+        return BasicStrategyBot(rules, num_decks)
+    if name == "i18":
+        return Illustrious18Bot(rules, num_decks, bet_spread=bet_spread)
+    if name == "random":
+        return RandomBot(make_rng(seed))
+    raise ValueError(f"Unknown strategy: {name!r}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.simulation.bot_runner",
+        description="Play bot strategies against the engine.",
+    )
+    parser.add_argument(
+        "--strategy", action="append", choices=STRATEGIES, help="Repeatable; default: basic"
+    )
+    parser.add_argument("--seats", type=int, default=1000, help="Seats per strategy")
+    parser.add_argument("--rounds", type=int, default=100, help="Rounds per seat")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--decks", type=int, default=6)
+    parser.add_argument("--bet", type=int, default=10)
+    parser.add_argument("--spread", type=int, default=1, help="i18 bet spread in units")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    names = args.strategy or ["basic"]
+    rules = GameRules()
+    runner = BotRunner(rules, num_decks=args.decks, seed=args.seed, bet=args.bet)
+    for name in names:
+        for _ in range(args.seats):
+            seed = derive_seed(args.seed, 2, len(runner.seats))
+            runner.add_seat(make_strategy(name, rules, args.decks, seed, args.spread))
+    print(f"Playing {args.rounds:,} rounds at {len(runner.seats):,} seats: {', '.join(names)}")
+
+    def print_progress(done: int, elapsed: float):
+        hands = sum(seat.stats.hands for seat in runner.seats)
+        rate = hands / elapsed if elapsed > 0 else 0.0
+        print(f"{done:>8,} rounds per seat  {rate:>12,.0f} hands/s")
+
+    runner.run(args.rounds, print_progress, progress_every=max(1, args.rounds // 10))
+
+    print()
+    rejected = defaultdict(int)
+    for seat in runner.seats:
+        rejected[seat.strategy.name] += seat.rejected
+    for name in dict.fromkeys(names):
+        stats = runner.totals(name)
+        spread = stats.total_wagered / (stats.rounds * args.bet) if stats.rounds else 0.0
+        print(
+            f"{name:<8} {stats.rounds:>12,} rounds  EV {stats.ev:+.4%} ± {stats.std_error:.4%}"
+            f"  avg bet {spread:.2f} units  rejected {rejected[name]:,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Multi-core Monte Carlo simulator for estimating house edge and variance.
+
+Rounds are split into shards and played on a ProcessPoolExecutor with
+the headless RoundEngine. Every shard owns its own Shoe and a
+reproducibly seeded RNG stream, and returns streaming aggregates that
+the parent merges as shards complete. The player follows the
+basic-strategy table for the rule set.
+"""
+
+import math
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from src.analysis.basic_strategy import (
+    DOUBLE,
+    HIT,
+    SPLIT,
+    BasicStrategy,
+    ensure_table,
+    load_basic_strategy,
+)
+from src.game.deck import Shoe
+from src.game.shuffle_pool import ShufflePool
+from src.game.player import Player
+from src.game.rng import derive_seed, make_rng
+from src.game.rules import GameRules
+from src.logic.round_engine import RoundEngine
+
+# Large enough that the simulated player never runs out of money.
+SIMULATION_BANKROLL = 10**12
+
+
+@dataclass
+class SimulationStats:
+    """Streaming aggregates for a batch of simulated rounds."""
+
+    rounds: int = 0
+    hands: int = 0  # Includes hands created by splitting
+    total_wagered: int = 0  # Initial bets only
+    sum_net: float = 0.0  # In units of the initial bet
+    sum_sq_net: float = 0.0
+    outcomes: Counter = field(default_factory=Counter)  # get_hand_result strings
+
+    def add_round(self, net_units: float):
+        self.rounds += 1
+        self.sum_net += net_units
+        self.sum_sq_net += net_units * net_units
+
+    def merge(self, other: "SimulationStats"):
+        """Folds another shard's aggregates into this one."""
+        self.rounds += other.rounds
+        self.hands += other.hands
+        self.total_wagered += other.total_wagered
+        self.sum_net += other.sum_net
+        self.sum_sq_net += other.sum_sq_net
+        self.outcomes.update(other.outcomes)
+
+    @property
+    def ev(self) -> float:
+        """Expected player return per round, in units of the initial bet."""
+        return self.sum_net / self.rounds if self.rounds else 0.0
+
+    @property
+    def std_dev(self) -> float:
+        """Standard deviation of a single round's result, in bet units."""
+        if self.rounds < 2:
+            return 0.0
+        mean = self.ev
+        variance = (self.sum_sq_net - self.rounds * mean * mean) / (self.rounds - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    @property
+    def std_error(self) -> float:
+        """Standard error of the EV estimate."""
+        return self.std_dev / math.sqrt(self.rounds) if self.rounds else 0.0
+
+
+def play_basic_strategy(engine: RoundEngine, strategy: BasicStrategy):
+    """
+    Plays the current round to completion with a basic-strategy table.
+    Insurance is always declined.
+    """
+    if engine.insurance_is_offered:
+        engine.insurance(False)
+
+    max_hands = engine.rules.max_splits + 1
+    hands = engine.player.hands
+    while engine.in_progress:
+        action = strategy.action_code(
+            engine.active_hand, engine.dealer.visible_value, len(hands) < max_hands
+        )
+        if action == SPLIT:
+            engine.split()
+        elif action == DOUBLE:
+            engine.double()
+        elif action == HIT:
+            engine.hit()
+        else:
+            engine.stand()
+
+
+def run_shard(
+    rules: GameRules,
+    num_decks: int,
+    rounds: int,
+    seed: int,
+    shard_index: int,
+    bet: int = 10,
+    pool_size: int = 64,
+    pool_refill: int = 0,
+) -> SimulationStats:
+    """
+    Plays one shard of rounds in the current process.
+    The shard's RNG stream is derived from (seed, shard_index) only, so
+    a shard replays identically no matter which worker runs it.
+    """
+    shard_seed = derive_seed(seed, shard_index)
+    strategy = load_basic_strategy(rules, num_decks)
+    pool = ShufflePool(num_decks, pool_size, pool_refill, seed=shard_seed)
+    shoe = Shoe(
+        num_decks=num_decks, verbose=False, shuffle_pool=pool, rng=make_rng(shard_seed)
+    )
+    engine = RoundEngine(
+        shoe=shoe,
+        player=Player(balance=SIMULATION_BANKROLL),
+        rules=rules,
+    )
+    player = engine.player
+    stats = SimulationStats()
+    outcomes = stats.outcomes
+
+    for _ in range(rounds):
+        player.balance = SIMULATION_BANKROLL
+        engine.deal(bet)
+        play_basic_strategy(engine, strategy)
+
+        outcome = engine.last_outcome
+        stats.add_round(outcome.net / bet)
+        stats.hands += len(outcome.results)
+        for result_str, _ in outcome.results:
+            outcomes[result_str] += 1
+
+    stats.total_wagered = rounds * bet
+    return stats
+
+
+def simulate(
+    rules: GameRules,
+    rounds: int,
+    num_decks: int = 6,
+    workers: Optional[int] = None,
+    shard_size: int = 100_000,
+    seed: int = 0,
+    bet: int = 10,
+    pool_size: int = 64,
+    pool_refill: int = 0,
+    progress: Optional[Callable[[SimulationStats, float], None]] = None,
+) -> SimulationStats:
+    """
+    Plays `rounds` rounds across a process pool and merges the results.
+    `progress` is called with the running totals and the elapsed time
+    every time a shard finishes.
+    """
+    shard_sizes = [shard_size] * (rounds // shard_size)
+    if rounds % shard_size:
+        shard_sizes.append(rounds % shard_size)
+
+    # Build the strategy table once; workers memory-map the cached file.
+    ensure_table(rules, num_decks)
+
+    total = SimulationStats()
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                run_shard,
+                rules,
+                num_decks,
+                size,
+                seed,
+                index,
+                bet,
+                pool_size,
+                pool_refill,
+            )
+            for index, size in enumerate(shard_sizes)
+        ]
+        for future in as_completed(futures):
+            total.merge(future.result())
+            if progress is not None:
+                progress(total, time.perf_counter() - start)
+    return total
@@ -0,0 +1,295 @@
+"""
+Bot strategies that play rounds without any clicks.
+
+A strategy is any object with `bet(view, base_bet)` and `decide(view)`.
+`decide` returns one of the RoundEngine action names (hit, stand,
+double, split, insurance, no_insurance). The DecisionView it gets reads
+cheap facts (hand total, upcard) straight from the engine; the full
+GameState, the true count and the shoe composition are only built when
+a strategy asks for them.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Callable, Mapping, Optional, Protocol, Union
+
+from src.analysis.basic_strategy import load_basic_strategy
+from src.analysis.dealer_probabilities import Composition
+from src.analysis.ev_oracle import ACTIONS, unseen_composition
+from src.game.counting import HI_LO, CountTracker
+from src.game.hand import Hand
+from src.game.rules import GameRules
+from src.logic.game_state import GameState
+from src.logic.round_engine import (
+    DECLINE_INSURANCE,
+    DOUBLE,
+    HIT,
+    SPLIT,
+    STAND,
+    TAKE_INSURANCE,
+    RoundEngine,
+)
+
+
+class DecisionView:
+    """What a strategy sees when it bets or acts. Everything is lazy."""
+
+    __slots__ = ("engine", "counter", "_state")
+
+    def __init__(self, engine: RoundEngine, counter: Optional[CountTracker] = None):
+        self.engine = engine
+        self.counter = counter
+        self._state: Optional[GameState] = None
+
+    @property
+    def insurance_offered(self) -> bool:
+        return self.engine.insurance_is_offered
+
+    @property
+    def hand(self) -> Optional[Hand]:
+        return self.engine.active_hand
+
+    @property
+    def hand_total(self) -> int:
+        return self.engine.active_hand.value
+
+    @property
+    def is_soft(self) -> bool:
+        return self.engine.active_hand.is_soft
+
+    @property
+    def upcard(self) -> int:
+        """The dealer's upcard value (Ace = 11)."""
+        return self.engine.dealer.visible_value
+
+    @property
+    def can_double(self) -> bool:
+        return self.engine.active_hand.can_double_down
+
+    @property
+    def can_split(self) -> bool:
+        engine = self.engine
+        return (
+            engine.active_hand.can_split
+            and len(engine.player.hands) < engine.rules.max_splits + 1
+        )
+
+    @property
+    def legal_actions(self) -> tuple[str, ...]:
+        if self.insurance_offered:
+            return (TAKE_INSURANCE, DECLINE_INSURANCE)
+        actions = [STAND, HIT]
+        if self.can_double:
+            actions.append(DOUBLE)
+        if self.can_split:
+            actions.append(SPLIT)
+        return tuple(actions)
+
+    @property
+    def key(self) -> tuple[int, bool, int, bool]:
+        """(hand total, soft, upcard, can split): a compact policy key."""
+        return (self.hand_total, self.is_soft, self.upcard, self.can_split)
+
+    def _hidden(self) -> tuple[int, ...]:
+        # The hole card is dealt but unseen until the dealer plays
+        engine = self.engine
+        return (engine.dealer.hidden_card.code,) if engine.hole_hidden else ()
+
+    def true_count(self, system: str = HI_LO.name) -> float:
+        """The true count as the player sees it (0.0 without a counter)."""
+        if self.counter is None:
+            return 0.0
+        return self.counter.true_count(system, self._hidden())
+
+    @property
+    def composition(self) -> Composition:
+        """The cards the player has not seen, hole card included."""
+        return unseen_composition(self.engine)
+
+    @property
+    def game_state(self) -> GameState:
+        """
+        An immutable snapshot of the table, built on first access. The
+        hole card is masked in it (see GameState) while it is face down.
+        """
+        if self._state is None:
+            self._state = GameState.from_engine(self.engine)
+        return self._state
+
+
+class Strategy(Protocol):
+    def bet(self, view: DecisionView, base_bet: int) -> int:
+        """The stake for the next round (`view` has no hand yet)."""
+        ...
+
+    def decide(self, view: DecisionView) -> str:
+        """The action to take (insurance or no_insurance when it is offered)."""
+        ...
+
+
+class Bot:
+    """
+    Base class for the bundled strategies: a name and flat bets.
+    Subclasses add decide() (see Strategy).
+    """
+
+    name = "bot"
+
+    def bet(self, view: DecisionView, base_bet: int) -> int:
+        return base_bet
+
+
+class BasicStrategyBot(Bot):
+    """Plays the precompiled basic-strategy table for the rule set."""
+
+    name = "basic"
+
+    def __init__(self, rules: GameRules, num_decks: int = 6):
+        self.table = load_basic_strategy(rules, num_decks)
+
+    def decide(self, view: DecisionView) -> str:
+        if view.insurance_offered:
+            return DECLINE_INSURANCE
+        return ACTIONS[self.table.action_code(view.hand, view.upcard, view.can_split)]
+
+
+@dataclass(frozen=True)
+class Deviation:
+    """Play `above` at or above true count `index`, else `below`."""
+
+    total: int
+    upcard: int
+    index: int
+    above: str
+    below: str
+    pair: bool = False  # Applies to a pair of tens instead of a hard total
+
+
+# The Illustrious 18 index plays for Hi-Lo (surrender plays excluded,
+# as the rules have no surrender). Insurance is taken at +3.
+# These are the S17 indices; see ILLUSTRIOUS_18_H17.
+INSURANCE_INDEX = 3
+ILLUSTRIOUS_18 = (
+    Deviation(16, 10, 0, STAND, HIT),
+    Deviation(15, 10, 4, STAND, HIT),
+    Deviation(20, 5, 5, SPLIT, STAND, pair=True),
+    Deviation(20, 6, 4, SPLIT, STAND, pair=True),
+    Deviation(10, 10, 4, DOUBLE, HIT),
+    Deviation(12, 3, 2, STAND, HIT),
+    Deviation(12, 2, 3, STAND, HIT),
+    Deviation(11, 11, 1, DOUBLE, HIT),
+    Deviation(9, 2, 1, DOUBLE, HIT),
+    Deviation(10, 11, 4, DOUBLE, HIT),
+    Deviation(9, 7, 3, DOUBLE, HIT),
+    Deviation(16, 9, 5, STAND, HIT),
+    Deviation(13, 2, -1, STAND, HIT),
+    Deviation(12, 4, 0, STAND, HIT),
+    Deviation(12, 5, -2, STAND, HIT),
+    Deviation(12, 6, -1, STAND, HIT),
+    Deviation(13, 3, -2, STAND, HIT),
+)
+
+# When the dealer hits soft 17, basic strategy already doubles 11 vs A,
+# and 10 vs A is doubled from +3.
+ILLUSTRIOUS_18_H17 = tuple(
+    Deviation(10, 11, 3, DOUBLE, HIT) if (d.total, d.upcard) == (10, 11) else d
+    for d in ILLUSTRIOUS_18
+    if (d.total, d.upcard) != (11, 11)
+)
+
+
+def illustrious_18(rules: GameRules) -> tuple[Deviation, ...]:
+    """The index set for the rule set's soft-17 rule."""
+    return ILLUSTRIOUS_18_H17 if rules.dealer_hits_on_soft_17 else ILLUSTRIOUS_18
+
+
+class Illustrious18Bot(BasicStrategyBot):
+    """
+    Basic strategy plus the Illustrious 18 count deviations (the S17 or
+    H17 set, to match the rules), with an optional bet ramp of one unit per true count up to `bet_spread` units.
+    The count is only read when a deviation could apply.
+    """
+
+    name = "i18"
+
+    def __init__(
+        self,
+        rules: GameRules,
+        num_decks: int = 6,
+        system: str = HI_LO.name,
+        bet_spread: int = 1,
+        deviations: Optional[tuple[Deviation, ...]] = None,
+    ):
+        super().__init__(rules, num_decks)
+        self.system = system
+        self.bet_spread = bet_spread
+        if deviations is None:
+            deviations = illustrious_18(rules)
+        self._deviations = {(d.total, d.upcard, d.pair): d for d in deviations}
+
+    def bet(self, view: DecisionView, base_bet: int) -> int:
+        if self.bet_spread <= 1:
+            return base_bet
+        units = int(view.true_count(self.system))
+        return base_bet * min(self.bet_spread, max(1, units))
+
+    def decide(self, view: DecisionView) -> str:
+        if view.insurance_offered:
+            take = view.true_count(self.system) >= INSURANCE_INDEX
+            return TAKE_INSURANCE if take else DECLINE_INSURANCE
+
+        hand = view.hand
+        can_split = view.can_split
+        tens = can_split and hand.cards[0].value == 10
+        if (can_split and not tens) or hand.is_soft:
+            return super().decide(view)  # Other pairs and soft hands
+
+        deviation = self._deviations.get((hand.value, view.upcard, tens))
+        if deviation is None:
+            return super().decide(view)
+        if view.true_count(self.system) >= deviation.index:
+            action = deviation.above
+        else:
+            action = deviation.below
+        if action == DOUBLE and not view.can_double:
+            action = HIT
+        return action
+
+
+class RandomBot(Bot):
+    """Picks uniformly among the legal actions."""
+
+    name = "random"
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng if rng is not None else random.Random()
+
+    def decide(self, view: DecisionView) -> str:
+        return self.rng.choice(view.legal_actions)
+
+
+class PolicyBot(Bot):
+    """
+    Plays a trained policy: a mapping (or function) from DecisionView.key
+    to an action. Missing or illegal answers go to `fallback`, or stand.
+    """
+
+    name = "policy"
+
+    def __init__(
+        self,
+        policy: Union[Mapping[tuple, str], Callable[[tuple], Optional[str]]],
+        fallback: Optional[Strategy] = None,
+        take_insurance: bool = False,
+    ):
+        self._lookup = policy.get if isinstance(policy, Mapping) else policy
+        self.fallback = fallback
+        self.take_insurance = take_insurance
+
+    def decide(self, view: DecisionView) -> str:
+        if view.insurance_offered:
+            return TAKE_INSURANCE if self.take_insurance else DECLINE_INSURANCE
+        action = self._lookup(view.key)
+        if action in view.legal_actions:
+            return action
+        return self.fallback.decide(view) if self.fallback is not None else STAND
@@ -0,0 +1,232 @@
+"""
+Vectorized NumPy evaluator for large batches of fixed-strategy rounds.
+
+Each round is one row of an (N x k) array of card codes, dealt in the
+same order as RoundEngine: player, dealer hole card, player, dealer
+upcard, then the player's hits followed by the dealer's draws. The
+fixed strategy hits until the hand reaches `stand_on` and never
+doubles or splits. Outcomes use the get_hand_result strings and agree
+with the scalar rules code (see cross_check).
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.game.deck import CARDS, NUM_CARDS, RANK_VALUES
+from src.game.hand import Hand
+from src.game.rules import GameRules, get_hand_result, should_dealer_hit
+
+# Outcome codes, in the precedence order used by get_hand_result.
+OUTCOMES = (
+    "push_blackjack",
+    "blackjack",
+    "bust",
+    "win_dealer_bust",
+    "win_higher",
+    "push",
+    "lose",
+)
+
+# Per-code lookup tables: hard value (Ace = 1) and Ace flag.
+_VALUES = np.frombuffer(RANK_VALUES, dtype=np.uint8)
+_HARD_VALUES = np.where(_VALUES == 11, 1, _VALUES).astype(np.int16)
+_IS_ACE = (_VALUES == 11).astype(np.int16)
+
+
+@dataclass
+class BatchResult:
+    """Per-round results of a vectorized batch."""
+
+    outcomes: np.ndarray  # Index into OUTCOMES
+    payouts: np.ndarray  # Returned to the player, including bets and insurance
+    net: np.ndarray  # payouts minus everything wagered
+    cards_used: np.ndarray  # Number of cards each round consumed
+
+    def outcome_counts(self) -> dict[str, int]:
+        counts = np.bincount(self.outcomes, minlength=len(OUTCOMES))
+        return {name: int(count) for name, count in zip(OUTCOMES, counts)}
+
+
+def _totals(hard: np.ndarray, aces: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized Hand.value / Hand.is_soft."""
+    soft = (aces > 0) & (hard <= 11)
+    return np.where(soft, hard + 10, hard), soft
+
+
+def _draw(slices, rows, pos, mask, hard, aces):
+    """Deals the next card of every masked row into (hard, aces)."""
+    if np.any(pos[mask] >= slices.shape[1]):
+        raise ValueError("Shoe slices are too short for this batch; increase k.")
+    idx = rows[mask]
+    codes = slices[idx, pos[mask]]
+    hard[idx] += _HARD_VALUES[codes]
+    aces[idx] += _IS_ACE[codes]
+    pos[idx] += 1
+
+
+def evaluate_batch(
+    shoe_slices: np.ndarray,
+    rules: GameRules,
+    bet: int = 10,
+    stand_on: int = 17,
+    take_insurance: bool = False,
+) -> BatchResult:
+    """Plays every row of `shoe_slices` at once and settles it."""
+    slices = np.asarray(shoe_slices)
+    n = slices.shape[0]
+    rows = np.arange(n)
+
+    p_hard = _HARD_VALUES[slices[:, 0]] + _HARD_VALUES[slices[:, 2]]
+    p_aces = _IS_ACE[slices[:, 0]] + _IS_ACE[slices[:, 2]]
+    d_hard = _HARD_VALUES[slices[:, 1]] + _HARD_VALUES[slices[:, 3]]
+    d_aces = _IS_ACE[slices[:, 1]] + _IS_ACE[slices[:, 3]]
+    pos = np.full(n, 4, dtype=np.int64)
+
+    p_blackjack = (p_aces == 1) & (p_hard == 11)
+    d_blackjack = (d_aces == 1) & (d_hard == 11)
+    playing = ~(p_blackjack | d_blackjack)
+
+    # --- Player: hit until stand_on ---
+    while True:
+        p_total, _ = _totals(p_hard, p_aces)
+        hitting = playing & (p_total < stand_on)
+        if not hitting.any():
+            break
+        _draw(slices, rows, pos, hitting, p_hard, p_aces)
+    p_total, _ = _totals(p_hard, p_aces)
+    p_bust = p_total > 21
+
+    # --- Dealer: draw to 17, hitting soft 17 under H17 ---
+    dealer_playing = playing & ~p_bust
+    while True:
+        d_total, d_soft = _totals(d_hard, d_aces)
+        hitting = dealer_playing & (
+            (d_total < 17)
+            | ((d_total == 17) & d_soft & rules.dealer_hits_on_soft_17)
+        )
+        if not hitting.any():
+            break
+        _draw(slices, rows, pos, hitting, d_hard, d_aces)
+    d_total, _ = _totals(d_hard, d_aces)
+
+    # --- Settle, in get_hand_result order ---
+    outcomes = np.select(
+        [
+            p_blackjack & d_blackjack,
+            p_blackjack,
+            p_bust,
+            d_total > 21,
+            p_total > d_total,
+            p_total == d_total,
+        ],
+        list(range(6)),
+        default=6,
+    ).astype(np.int8)
+
+    win_payout = bet + int(bet * rules.standard_payout)
+    payout_table = np.array(
+        [
+            bet,  # push_blackjack
+            bet + int(bet * rules.blackjack_payout),  # blackjack
+            0,  # bust
+            win_payout,  # win_dealer_bust
+            win_payout,  # win_higher
+            bet,  # push
+            0,  # lose
+        ],
+        dtype=np.int64,
+    )
+    payouts = payout_table[outcomes]
+    wagered = np.full(n, bet, dtype=np.int64)
+
+    if take_insurance:
+        insurance_cost = int(bet / 2)
+        offered = _IS_ACE[slices[:, 3]] == 1
+        insurance_return = insurance_cost + int(insurance_cost * rules.insurance_payout)
+        payouts = payouts + np.where(offered & d_blackjack, insurance_return, 0)
+        wagered = wagered + np.where(offered, insurance_cost, 0)
+
+    return BatchResult(
+        outcomes=outcomes,
+        payouts=payouts,
+        net=payouts - wagered,
+        cards_used=pos,
+    )
+
+
+def draw_shoe_slices(
+    rng: np.random.Generator,
+    rounds: int,
+    k: int = 24,
+    num_decks: int = 6,
+    chunk: int = 65_536,
+) -> np.ndarray:
+    """
+    Draws `rounds` independent slices of `k` cards, each the top of a
+    freshly shuffled shoe. Only the first k steps of a Fisher-Yates
+    shuffle are performed, vectorized across the rows of a chunk.
+    """
+    shoe = np.tile(np.arange(NUM_CARDS, dtype=np.uint8), num_decks)
+    out = np.empty((rounds, k), dtype=np.uint8)
+    for start in range(0, rounds, chunk):
+        stop = min(start + chunk, rounds)
+        block = np.tile(shoe, (stop - start, 1))
+        rows = np.arange(stop - start)
+        for j in range(k):
+            swap = rng.integers(j, shoe.size, size=stop - start)
+            picked = block[rows, swap]
+            block[rows, swap] = block[:, j]
+            block[:, j] = picked
+        out[start:stop] = block[:, :k]
+    return out
+
+
+def _play_scalar(row, rules: GameRules, bet: int, stand_on: int, take_insurance: bool):
+    """Plays one row with Hand, should_dealer_hit and get_hand_result."""
+    cards = iter(CARDS[code] for code in row)
+    player, dealer = Hand(bet=bet), Hand()
+    player.add_card(next(cards))
+    dealer.add_card(next(cards))
+    player.add_card(next(cards))
+    dealer.add_card(next(cards))
+
+    if not (player.is_blackjack or dealer.is_blackjack):
+        while player.value < stand_on:
+            player.add_card(next(cards))
+        if not player.is_bust:
+            while should_dealer_hit(dealer, rules):
+                dealer.add_card(next(cards))
+
+    result_str, payout = get_hand_result(player, dealer, rules)
+    if take_insurance and dealer.cards[1].value == 11 and dealer.is_blackjack:
+        insurance_cost = int(bet / 2)
+        payout += insurance_cost + int(insurance_cost * rules.insurance_payout)
+    return result_str, payout
+
+
+def cross_check(
+    shoe_slices: np.ndarray,
+    result: BatchResult,
+    rules: GameRules,
+    bet: int = 10,
+    stand_on: int = 17,
+    take_insurance: bool = False,
+    sample: int = 1000,
+    seed: int = 0,
+) -> list[int]:
+    """
+    Replays a random sample of rows through the scalar rules code.
+    Returns the indices of rows whose outcome or payout disagree.
+    """
+    rng = np.random.default_rng(seed)
+    n = len(shoe_slices)
+    indices = rng.choice(n, size=min(sample, n), replace=False)
+    mismatches = []
+    for i in indices:
+        result_str, payout = _play_scalar(
+            shoe_slices[i], rules, bet, stand_on, take_insurance
+        )
+        if OUTCOMES[result.outcomes[i]] != result_str or result.payouts[i] != payout:
+            mismatches.append(int(i))
+    return mismatches
@@ -0,0 +1,207 @@
+"""
+Central scheduler for card flights from the deck to the table.
+
+Every dealt card becomes a flight. Flights queued in the same turn of
+the event loop (the opening deal, or all of a dealer's draws) are
+coalesced into one burst and played as a QParallelAnimationGroup with
+the cards staggered; bursts play one after another. Cards land when
+their group reports `finished`, never on a fixed timer. In turbo mode
+flights land immediately.
+"""
+
+from collections import deque
+from typing import Callable, Optional
+
+from PySide6.QtCore import (
+    QObject, QParallelAnimationGroup, QPoint, QSequentialAnimationGroup,
+    QTimer, Signal
+)
+from src.ui.components.card_widget import CardWidget
+
+
+class Flight:
+    """One card flying from `start` to `end`, then handed to `on_land`."""
+
+    __slots__ = ("widget", "start", "end", "on_land", "sequence", "cancelled")
+
+    def __init__(self, widget: CardWidget, start: QPoint, end: QPoint,
+                 on_land: Callable[[CardWidget], None]):
+        self.widget = widget
+        self.start = start
+        self.end = end
+        self.on_land = on_land
+        self.sequence: Optional[QSequentialAnimationGroup] = None
+        self.cancelled = False
+
+
+class AnimationScheduler(QObject):
+    """
+    Queues card flights and plays them in coalesced bursts.
+
+    origin: where flights start (the deck), in the cards' parent coordinates.
+    duration: flight time of one card in ms.
+    stagger: delay between the cards of one burst in ms.
+    """
+
+    idle = Signal()  # Everything queued so far has landed
+
+    def __init__(self, parent=None, duration: int = 450, stagger: int = 150):
+        super().__init__(parent)
+        self.origin = QPoint(0, 0)
+        self.duration = duration
+        self.stagger = stagger
+        self.turbo = False
+
+        self._collecting: list[Flight] = []  # The burst being collected
+        self._bursts: deque[list[Flight]] = deque()
+        self._group: Optional[QParallelAnimationGroup] = None
+        self._running: list[Flight] = []
+        self._idle_callbacks: list[Callable[[], None]] = []
+
+        # Fires once control returns to the event loop, closing the burst
+        self._burst_timer = QTimer(self)
+        self._burst_timer.setSingleShot(True)
+        self._burst_timer.setInterval(0)
+        self._burst_timer.timeout.connect(self._close_burst)
+
+    @property
+    def is_idle(self) -> bool:
+        return self._group is None and not self._bursts and not self._collecting
+
+    def fly(self, widget: CardWidget, end: QPoint,
+            on_land: Callable[[CardWidget], None], start: Optional[QPoint] = None):
+        """Queues a card flight; `on_land(widget)` runs when it arrives."""
+        flight = Flight(widget, start if start is not None else self.origin, end, on_land)
+        if self.turbo:
+            self._land(flight)
+            return
+        widget.move(flight.start)
+        widget.raise_()
+        widget.show()
+        self._collecting.append(flight)
+        self._burst_timer.start()
+
+    def when_idle(self, callback: Callable[[], None]):
+        """Runs `callback` once every queued flight has landed (now, if idle)."""
+        if self.is_idle:
+            callback()
+        else:
+            self._idle_callbacks.append(callback)
+
+    def set_turbo(self, turbo: bool):
+        """Turbo skips the animations; turning it on lands everything now."""
+        self.turbo = turbo
+        if turbo:
+            self.finish_all()
+
+    def finish_all(self):
+        """Lands every running and queued flight immediately."""
+        self._burst_timer.stop()
+        flights = self._stop_group()
+        for burst in self._bursts:
+            flights.extend(burst)
+        flights.extend(self._collecting)
+        self._bursts.clear()
+        self._collecting = []
+        for flight in flights:
+            self._land(flight)
+        self._notify_idle()
+
+    def cancel(self, widget: CardWidget):
+        """Drops the flight of `widget` (e.g. it left the table mid-air)."""
+        self._collecting = [f for f in self._collecting if f.widget is not widget]
+        for burst in self._bursts:
+            burst[:] = [f for f in burst if f.widget is not widget]
+        for flight in self._running:
+            if flight.widget is widget:
+                flight.cancelled = True
+                self._take_back(flight)
+
+    def clear(self):
+        """Cancels everything without landing it (the table was cleared)."""
+        self._burst_timer.stop()
+        for flight in self._stop_group():
+            flight.cancelled = True
+        self._bursts.clear()
+        self._collecting = []
+        self._idle_callbacks = []
+
+    # --- Internals ---
+
+    def _close_burst(self):
+        if self._collecting:
+            self._bursts.append(self._collecting)
+            self._collecting = []
+        self._start_next()
+
+    def _start_next(self):
+        if self._group is not None:
+            return
+        while self._bursts and not self._bursts[0]:
+            self._bursts.popleft()
+        if not self._bursts:
+            if not self._collecting:
+                self._notify_idle()
+            return
+
+        flights = self._bursts.popleft()
+        group = QParallelAnimationGroup(self)
+        for i, flight in enumerate(flights):
+            sequence = QSequentialAnimationGroup()
+            if i:
+                sequence.addPause(i * self.stagger)
+            sequence.addAnimation(
+                flight.widget.animate_deal(flight.start, flight.end, self.duration)
+            )
+            group.addAnimation(sequence)
+            flight.sequence = sequence
+        group.finished.connect(self._on_group_finished)
+
+        self._group = group
+        self._running = flights
+        group.start()
+
+    def _on_group_finished(self):
+        flights = self._stop_group()
+        for flight in flights:
+            self._land(flight)
+        self._start_next()
+
+    def _stop_group(self) -> list[Flight]:
+        """Stops the running group and returns the animations to their cards."""
+        group, flights = self._group, self._running
+        self._group = None
+        self._running = []
+        if group is not None:
+            # stop() does not emit `finished`, so no need to disconnect.
+            group.stop()
+            for flight in flights:
+                self._take_back(flight)
+            group.deleteLater()
+        return flights
+
+    @staticmethod
+    def _take_back(flight: Flight):
+        # The card widget owns its (reused) deal animation, not the group.
+        sequence = flight.sequence
+        flight.sequence = None
+        if sequence is None:
+            return
+        animation = flight.widget.deal_animation
+        index = sequence.indexOfAnimation(animation)
+        if index >= 0:
+            sequence.takeAnimation(index)
+            animation.setParent(flight.widget)
+        animation.stop()
+
+    def _land(self, flight: Flight):
+        if flight.cancelled:
+            return
+        flight.widget.move(flight.end)
+        flight.on_land(flight.widget)
+
+    def _notify_idle(self):
+        callbacks, self._idle_callbacks = self._idle_callbacks, []
+        for callback in callbacks:
+            callback()
+        self.idle.emit()
@@ -0,0 +1,84 @@
+"""
+Shared, pre-scaled card pixmaps.
+
+Every card face and the card back is read from disk once. The scaled
+pixmaps are built for one (width, height, device pixel ratio) at a time
+and shared by all CardWidgets; they are only rebuilt when the card size
+or the screen's pixel ratio changes.
+"""
+
+from typing import Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QPixmap
+from src.game.deck import IMAGE_NAMES, NUM_CARDS
+from src.utils.constants import CARD_ASSET_PATH, CARD_WIDTH, CARD_HEIGHT
+
+BACK_IMAGE = "card_back.png"
+
+
+class CardAtlas:
+    """Card pixmaps by card code, plus the back, at one size."""
+
+    def __init__(self, asset_path: str = CARD_ASSET_PATH):
+        self.asset_path = asset_path
+        self._images: dict[str, QImage] = {}  # Unscaled, by file name
+        self._pixmaps: dict[str, QPixmap] = {}  # Scaled, by file name
+        self._key: Optional[tuple[int, int, float]] = None
+
+    def _image(self, name: str) -> QImage:
+        image = self._images.get(name)
+        if image is None:
+            path = f"{self.asset_path}{name}"
+            image = QImage(path)
+            if image.isNull():
+                print(f"Failed to load: {path}")
+            self._images[name] = image
+        return image
+
+    def _pixmap(self, name: str, width: int, height: int, dpr: float) -> QPixmap:
+        key = (width, height, dpr)
+        if key != self._key:
+            # New size or pixel ratio: drop every scaled pixmap.
+            self._pixmaps.clear()
+            self._key = key
+
+        pixmap = self._pixmaps.get(name)
+        if pixmap is None:
+            image = self._image(name)
+            if image.isNull():
+                pixmap = QPixmap()
+            else:
+                pixmap = QPixmap.fromImage(image.scaled(
+                    round(width * dpr), round(height * dpr),
+                    Qt.KeepAspectRatio, Qt.SmoothTransformation,
+                ))
+                pixmap.setDevicePixelRatio(dpr)
+            self._pixmaps[name] = pixmap
+        return pixmap
+
+    def front(self, code: int, width: int = CARD_WIDTH, height: int = CARD_HEIGHT,
+              dpr: float = 1.0) -> QPixmap:
+        return self._pixmap(IMAGE_NAMES[code], width, height, dpr)
+
+    def back(self, width: int = CARD_WIDTH, height: int = CARD_HEIGHT,
+             dpr: float = 1.0) -> QPixmap:
+        return self._pixmap(BACK_IMAGE, width, height, dpr)
+
+    def preload(self, width: int = CARD_WIDTH, height: int = CARD_HEIGHT,
+                dpr: float = 1.0):
+        """Loads and scales all 52 faces and the back up front."""
+        self.back(width, height, dpr)
+        for code in range(NUM_CARDS):
+            self.front(code, width, height, dpr)
+
+
+_atlas: Optional[CardAtlas] = None
+
+
+def card_atlas() -> CardAtlas:
+    """The atlas shared by every CardWidget (created on first use)."""
+    global _atlas
+    if _atlas is None:
+        _atlas = CardAtlas()
+    return _atlas
@@ -0,0 +1,54 @@
+"""
+A pool of CardWidgets that are recycled across rounds.
+"""
+
+from typing import Optional
+
+from PySide6.QtWidgets import QWidget
+from src.game.deck import Card
+from src.ui.components.card_widget import CardWidget
+
+
+class CardWidgetPool:
+    """
+    Hands out CardWidgets and takes them back when they leave the table.
+    Released widgets are reset and parked on a hidden holder
+    widget instead of being deleted, so a new round reuses them (and
+    their animations) rather than allocating new ones.
+
+    max_idle: widgets kept for reuse; any beyond that are deleted.
+    """
+
+    def __init__(self, max_idle: int = 64):
+        self.max_idle = max_idle
+        self._holder = QWidget()
+        self._holder.hide()
+        self._idle: list[CardWidget] = []
+
+    def acquire(self, card: Optional[Card], parent: Optional[QWidget] = None,
+                face_up: bool = True) -> CardWidget:
+        if self._idle:
+            card_widget = self._idle.pop()
+            card_widget.set_card(card)
+            card_widget.setParent(parent)
+        else:
+            card_widget = CardWidget(card, parent)
+        if face_up:
+            card_widget.show_front()
+        else:
+            card_widget.show_back()
+        return card_widget
+
+    def release(self, card_widget: CardWidget):
+        card_widget.reset()
+        # Reparenting hides the widget without marking it explicitly
+        # hidden, so a layout will show it again when it is reused.
+        if len(self._idle) < self.max_idle:
+            card_widget.setParent(self._holder)
+            self._idle.append(card_widget)
+        else:
+            card_widget.setParent(None)
+            card_widget.deleteLater()
+
+    def __len__(self) -> int:
+        return len(self._idle)
@@ -3,19 +3,18 @@ Custom CardWidget component.
 """
 
 from PySide6.QtWidgets import QLabel
-from PySide6.QtGui import QPixmap, QPixmapCache
-from PySide6.QtCore import Qt, QPropertyAnimation, QTimer
+from PySide6.QtCore import QEvent, QPoint, QPropertyAnimation, QTimer
 from src.game.deck import Card
-from src.utils.constants import CARD_ASSET_PATH, CARD_WIDTH, CARD_HEIGHT
+from src.ui.components.card_atlas import card_atlas
+from src.utils.constants import CARD_WIDTH, CARD_HEIGHT
 from typing import Optional
 
 # --- NEW IMPORT ---
-from src.utils.animations import create_flip_animation
+from src.utils.animations import (
+    create_deal_animation, create_flip_animation, set_flip_keyframes
+)
 # --- END IMPORT ---
 
-# Your cache-disabling code
-QPixmapCache.setCacheLimit(1)
-
 
 class CardWidget(QLabel):
     def __init__(self, card: Optional[Card] = None, parent=None):
@@ -23,39 +22,74 @@ class CardWidget(QLabel):
         self.card = card
         self.setFixedSize(CARD_WIDTH, CARD_HEIGHT)
         self.is_face_up = False # Track state
-        self.animation = None # To hold the animation
-
-        # Your force-load logic
-        back_path = f"{CARD_ASSET_PATH}card_back.png"
-        self.back_pixmap = QPixmap(back_path)
-        if self.back_pixmap.isNull():
-            print(f"Failed to load: {back_path}")
-        self.back_pixmap = self.back_pixmap.scaled(
-            self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
+        # Animations are created on first use and then reused
+        self.animation = None # Flip
+        self.deal_animation = None # Fly-in from the deck
+        self._flip_timer = QTimer(self)
+        self._flip_timer.setSingleShot(True)
+        self._flip_timer.timeout.connect(self.show_front)
 
+        # Pixmaps are shared with every other card (no disk I/O here)
+        self.back_pixmap = None
         self.front_pixmap = None
-        if self.card:
-            self.load_front_pixmap() # Load front pixmap
+        self.load_pixmaps()
 
         self.show_back()
 
+    def load_pixmaps(self):
+        """Picks up the shared pixmaps for the current card and screen."""
+        self.back_pixmap = card_atlas().back(
+            CARD_WIDTH, CARD_HEIGHT, self.devicePixelRatioF()
+        )
+        self.front_pixmap = None
+        self.load_front_pixmap()
+
     def load_front_pixmap(self):
         """Helper to load the front pixmap."""
         if not self.card:
             return
-        image_file = f"{CARD_ASSET_PATH}{self.card.image_name}"
-        self.front_pixmap = QPixmap(image_file)
-        if self.front_pixmap.isNull():
-            print(f"Failed to load: {image_file}")
-        self.front_pixmap = self.front_pixmap.scaled(
-            self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
+        self.front_pixmap = card_atlas().front(
+            self.card.code, CARD_WIDTH, CARD_HEIGHT, self.devicePixelRatioF()
         )
 
-    def set_card(self, card: Card):
+    def set_card(self, card: Optional[Card]):
         self.card = card
+        self.front_pixmap = None
         self.load_front_pixmap()
 
+    def reset(self):
+        """Stops any animation and shows the back, ready for reuse."""
+        self._flip_timer.stop()
+        for anim in (self.animation, self.deal_animation):
+            if anim is not None:
+                anim.stop()
+        self.setFixedSize(CARD_WIDTH, CARD_HEIGHT)
+        self.setText("")
+        self.show_back()
+
+    def animate_deal(self, start_pos: QPoint, end_pos: QPoint,
+                     duration: int = 600) -> QPropertyAnimation:
+        """Returns this card's (reused) fly-in animation, set up but not started."""
+        if self.deal_animation is None:
+            self.deal_animation = create_deal_animation(self, start_pos, end_pos, duration)
+            self.deal_animation.setParent(self)
+        else:
+            self.deal_animation.stop()
+            self.deal_animation.setDuration(duration)
+            self.deal_animation.setStartValue(start_pos)
+            self.deal_animation.setEndValue(end_pos)
+        return self.deal_animation
+
+    def changeEvent(self, event):
+        # Moved to a screen with a different pixel ratio: re-fetch.
+        if event.type() == QEvent.DevicePixelRatioChange:
+            self.load_pixmaps()
+            if self.is_face_up:
+                self.show_front()
+            else:
+                self.show_back()
+        super().changeEvent(event)
+
     def show_back(self):
         self.setPixmap(self.back_pixmap)
         self.is_face_up = False
@@ -76,19 +110,17 @@ class CardWidget(QLabel):
         if self.is_face_up or not self.front_pixmap:
             return
 
-        # 1. Create the animation
-        self.animation = create_flip_animation(self)
-        
-        # 2. Connect the halfway point (at 200ms) to the
-        #    function that actually switches the image.
-        QTimer.singleShot(200, self.show_front)
-        
+        # 1. Create the animation once, then just refresh its keyframes
+        if self.animation is None:
+            self.animation = create_flip_animation(self)
+            self.animation.setParent(self)
+        else:
+            self.animation.stop()
+            set_flip_keyframes(self.animation, self)
+
+        # 2. Switch the image at the halfway point (200ms).
+        self._flip_timer.start(200)
+
         # 3. Start the animation
-        self.animation.start(QPropertyAnimation.DeleteWhenStopped)
+        self.animation.start()
     # --- END NEW METHOD ---
-
-    def __del__(self):
-        if self.front_pixmap and not self.front_pixmap.isNull():
-            self.front_pixmap = QPixmap()
-        if self.back_pixmap and not self.back_pixmap.isNull():
-            self.back_pixmap = QPixmap()
\ No newline at end of file
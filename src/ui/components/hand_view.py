@@ -0,0 +1,141 @@
+"""
+HandView: the card widgets of one hand currently on screen.
+"""
+
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from PySide6.QtCore import QPoint
+from PySide6.QtWidgets import QHBoxLayout, QLayout
+from src.game.deck import CARDS, Card
+from src.logic.game_state import HIDDEN_CARD
+from src.ui.components.card_pool import CardWidgetPool
+from src.ui.components.card_widget import CardWidget
+from src.utils.constants import CARD_WIDTH, CARD_HEIGHT
+
+if TYPE_CHECKING:
+    from src.ui.animation_scheduler import AnimationScheduler
+
+CARD_SPACING = 6  # Used to aim flights before the layout has placed a card
+
+
+def _card(code: int) -> Optional[Card]:
+    """The shared Card for `code`, or None for the hidden hole card."""
+    return None if code == HIDDEN_CARD else CARDS[code]
+
+
+class HandView:
+    """
+    Keeps a row layout in step with a hand's cards.
+    sync() keeps every widget whose card is unchanged and only creates
+    widgets for cards that are new, so updating a hand costs the same
+    no matter how many other hands are on the table.
+
+    With a scheduler, new cards fly in from the deck and join the row
+    when they land. `anchor` is a layout to aim at while the row is
+    still empty.
+    """
+
+    def __init__(self, row: QHBoxLayout, pool: CardWidgetPool,
+                 scheduler: Optional["AnimationScheduler"] = None,
+                 anchor: Optional[QLayout] = None):
+        self.row = row
+        self.pool = pool
+        self.scheduler = scheduler
+        self.anchor = anchor
+        self.card_widgets: list[CardWidget] = []  # In hand order, landed or not
+        self._flying: set[CardWidget] = set()
+
+    def adopt(self, card_widget: CardWidget):
+        """Takes over an existing widget as the next card."""
+        card_widget.setParent(self.row.parentWidget())
+        self.row.addWidget(card_widget)
+        self.card_widgets.append(card_widget)
+
+    def deal(self, code: int, face_up: bool = True) -> CardWidget:
+        """
+        Adds a card (by code) to the end of the hand, flying it in if
+        animated. HIDDEN_CARD deals a card whose face is not known yet.
+        """
+        card = _card(code)
+        index = len(self.card_widgets)
+        if self.scheduler is None:
+            card_widget = self.pool.acquire(card, face_up=face_up)
+            self.adopt(card_widget)
+            return card_widget
+
+        card_widget = self.pool.acquire(card, self.row.parentWidget(), face_up)
+        self.card_widgets.append(card_widget)
+        self._flying.add(card_widget)
+        self.scheduler.fly(card_widget, self._slot_pos(index), self._land)
+        return card_widget
+
+    def sync(self, cards: Sequence[int]) -> list[CardWidget]:
+        """
+        Makes the row show `cards` (card codes). Returns the widgets it
+        created (face up, unless hidden). A hidden card whose code has become known
+        keeps its widget and just learns its face.
+        """
+        keep = 0
+        for card_widget, code in zip(self.card_widgets, cards):
+            # Cards are shared instances, so identity is enough
+            card = _card(code)
+            if card_widget.card is not card:
+                if card_widget.card is not None or card is None:
+                    break
+                card_widget.set_card(card)  # The hole card, still face down
+            keep += 1
+
+        # A split moves the second card away, so drop anything that
+        # no longer matches before appending.
+        for card_widget in self.card_widgets[keep:]:
+            self._discard(card_widget)
+        del self.card_widgets[keep:]
+
+        return [self.deal(code, code != HIDDEN_CARD) for code in cards[keep:]]
+
+    def codes(self) -> tuple[int, ...]:
+        """The card codes on screen (HIDDEN_CARD for an unknown face)."""
+        return tuple([
+            HIDDEN_CARD if cw.card is None else cw.card.code for cw in self.card_widgets
+        ])
+
+    def clear(self):
+        for card_widget in self.card_widgets:
+            self._discard(card_widget)
+        self.card_widgets = []
+
+    def _land(self, card_widget: CardWidget):
+        self._flying.discard(card_widget)
+        index = 0
+        for other in self.card_widgets:
+            if other is card_widget:
+                break
+            if other not in self._flying:
+                index += 1
+        self.row.insertWidget(index, card_widget)
+
+    def _slot_pos(self, index: int) -> QPoint:
+        """Roughly where card `index` will sit; the layout snaps it on landing."""
+        step = CARD_WIDTH + CARD_SPACING
+        for i, card_widget in enumerate(self.card_widgets):
+            if card_widget not in self._flying:
+                pos = card_widget.pos()
+                return QPoint(pos.x() + (index - i) * step, pos.y())
+
+        rect = self.row.geometry()
+        if not rect.isValid() and self.anchor is not None:
+            rect = self.anchor.geometry()
+        center = rect.center()
+        return QPoint(center.x() - CARD_WIDTH // 2 + index * step,
+                      center.y() - CARD_HEIGHT // 2)
+
+    def _discard(self, card_widget: CardWidget):
+        if card_widget in self._flying:
+            self._flying.discard(card_widget)
+            self.scheduler.cancel(card_widget)
+        else:
+            self.row.removeWidget(card_widget)
+        self.pool.release(card_widget)
+
+    def __len__(self) -> int:
+        return len(self.card_widgets)
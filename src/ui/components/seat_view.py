@@ -0,0 +1,128 @@
+"""
+SeatView: one seat's hands on screen.
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QHBoxLayout, QLabel, QLayout, QVBoxLayout
+from src.logic.game_state import SeatState
+from src.ui.components.card_pool import CardWidgetPool
+from src.ui.components.hand_view import HandView
+from src.utils.constants import GOLD_ACCENT
+
+if TYPE_CHECKING:
+    from src.ui.animation_scheduler import AnimationScheduler
+
+
+def _clear_layout(layout: QLayout):
+    """Deletes every widget and sub-layout of `layout`."""
+    while layout.count():
+        item = layout.takeAt(0)
+        widget = item.widget()
+        if widget:
+            widget.setParent(None)
+            widget.deleteLater()
+        else:
+            child = item.layout()
+            if child:
+                _clear_layout(child)
+                child.deleteLater()
+
+
+class SeatView:
+    """
+    A seat's title and one box (score label and card row) per hand,
+    added to `parent_layout`. The view lives as long as the window;
+    sync() reconciles it with a SeatState and clear() empties it
+    between rounds. The title is only shown at multi-seat tables.
+    """
+
+    def __init__(self, index: int, parent_layout: QHBoxLayout, pool: CardWidgetPool,
+                 scheduler: Optional["AnimationScheduler"] = None,
+                 show_title: bool = True):
+        self.index = index
+        self.pool = pool
+        self.scheduler = scheduler
+        self.show_title = show_title
+
+        self.layout = QVBoxLayout()
+        self.layout.setAlignment(Qt.AlignHCenter | Qt.AlignTop)
+        self.title = QLabel(f"Seat {index + 1}")
+        self.title.setObjectName("SeatLabel")
+        self.title.setAlignment(Qt.AlignCenter)
+        if not show_title:
+            self.title.hide()
+        self.layout.addWidget(self.title)
+
+        self.hands_layout = QHBoxLayout()
+        self.hands_layout.setAlignment(Qt.AlignCenter)
+        self.layout.addLayout(self.hands_layout)
+        parent_layout.addLayout(self.layout)
+        # Where a hand's first card flies to before its row has a size:
+        # the seat box (sized by its title), or the whole player area.
+        self._anchor = self.layout if show_title else parent_layout
+
+        self.hand_views: list[HandView] = []
+        self.score_labels: list[QLabel] = []
+
+    def hand_view(self, index: int) -> HandView:
+        """The view for hand `index`, creating hand boxes as needed."""
+        while len(self.hand_views) <= index:
+            vlay = QVBoxLayout()
+            vlay.setAlignment(Qt.AlignCenter)
+            score = QLabel("")
+            score.setObjectName("ScoreLabel")
+            vlay.addWidget(score)
+
+            hlay = QHBoxLayout()
+            vlay.addLayout(hlay)
+            self.hands_layout.addLayout(vlay)
+
+            self.score_labels.append(score)
+            self.hand_views.append(
+                HandView(hlay, self.pool, self.scheduler, self._anchor)
+            )
+        return self.hand_views[index]
+
+    def shows(self, seat: SeatState) -> bool:
+        """True if exactly the seat's cards are on screen."""
+        return len(self.hand_views) == len(seat.hands) and all(
+            view.codes() == hand.cards
+            for view, hand in zip(self.hand_views, seat.hands)
+        )
+
+    def sync(self, seat: SeatState, active_hand: Optional[int] = None,
+             highlight: bool = False):
+        """
+        Shows `seat`: deals new cards and updates labels in place.
+        `active_hand` is the hand being played, if this seat is acting;
+        it (and the title) turn gold when `highlight` is set.
+        """
+        for i, hand in enumerate(seat.hands):
+            self.hand_view(i).sync(hand.cards)
+
+            score = self.score_labels[i]
+            _set_text(score, f"Hand {i+1}: {hand.value}")
+            style = f"color: {GOLD_ACCENT};" if highlight and i == active_hand else ""
+            if score.styleSheet() != style:
+                score.setStyleSheet(style)
+
+        if self.show_title:
+            out = "" if seat.seated else " (sitting out)"
+            _set_text(self.title, f"Seat {self.index + 1}: ${seat.balance}{out}")
+            style = f"color: {GOLD_ACCENT};" if highlight and active_hand is not None else ""
+            if self.title.styleSheet() != style:
+                self.title.setStyleSheet(style)
+
+    def clear(self):
+        for view in self.hand_views:
+            view.clear()
+        _clear_layout(self.hands_layout)
+        self.hand_views = []
+        self.score_labels = []
+
+
+def _set_text(label: QLabel, text: str):
+    if label.text() != text:
+        label.setText(text)
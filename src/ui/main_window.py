@@ -4,13 +4,16 @@ Main application window (QMainWindow) — ANIMATED CARDS + CLEAN UI
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QSpacerItem, QSizePolicy
+    QPushButton, QLabel, QSpacerItem, QSizePolicy, QCheckBox
 )
 from PySide6.QtGui import QIcon, QPixmap, QImage
-from PySide6.QtCore import Qt, Slot, QSize, QByteArray, QTimer, QPropertyAnimation, QEasingCurve, QPoint
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QByteArray, QTimer
 from src.logic.game_engine import GameEngine, GameState
-from src.ui.components.card_widget import CardWidget
-from src.utils.constants import GOLD_ACCENT
+from src.ui.animation_scheduler import AnimationScheduler
+from src.ui.components.card_pool import CardWidgetPool
+from src.ui.components.hand_view import HandView
+from src.ui.components.seat_view import SeatView
+from typing import Optional
 
 
 # === SVG DATA (EMBEDDED) ===
@@ -30,19 +33,28 @@ DOWN_ARROW_SVG = '''
 
 
 class MainWindow(QMainWindow):
+    first_frame = Signal()  # Emitted once, right after the first paint
+
     def __init__(self, engine: GameEngine):
         super().__init__()
         self.engine = engine
+        self._painted = False
+
+        # Card widgets are recycled between rounds
+        self.card_pool = CardWidgetPool()
+
+        # What is on screen, reconciled with the engine by update_ui()
+        self.dealer_hand_view: Optional[HandView] = None
+        self.seat_views: list[SeatView] = []  # One per seat, kept across rounds
+        self.dealer_revealed = False
 
-        self.dealer_hand_widgets: list[CardWidget] = []
-        self.player_hands_widgets: list[list[CardWidget]] = []
-        self.player_hands_layouts: list[QVBoxLayout] = []
-        self.player_hands_score_labels: list[QLabel] = []
+        # Every dealt card flies in from the deck through the scheduler
+        self.animations = AnimationScheduler(self)
 
-        self.animating_cards: list[tuple[CardWidget, QHBoxLayout, QPoint]] = []
-        self.animation_timer = QTimer()
-        self.animation_timer.setSingleShot(True)
-        self.animation_timer.timeout.connect(self.finish_animations)
+        # Clears the table a while after a round ends (unless a new one starts)
+        self.reset_timer = QTimer(self)
+        self.reset_timer.setSingleShot(True)
+        self.reset_timer.timeout.connect(self.reset_table)
 
         self.init_ui()
         self.connect_signals()
@@ -64,6 +76,13 @@ class MainWindow(QMainWindow):
         self.deck_reference.setFixedSize(120, 160)
         self.deck_reference.move(50, 50)
         self.deck_reference.hide()
+        self.animations.origin = self.deck_reference.pos()
+
+        # --- Card count overlay (top right, floats over the table) ---
+        self.count_label = QLabel(central_widget)
+        self.count_label.setObjectName("CountLabel")
+        self.count_label.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.count_label.hide()
 
         # --- Dealer Area ---
         self.dealer_score_label = QLabel("Dealer: ?")
@@ -72,6 +91,9 @@ class MainWindow(QMainWindow):
 
         self.dealer_hand_layout = QHBoxLayout()
         self.dealer_hand_layout.setAlignment(Qt.AlignCenter)
+        self.dealer_hand_view = HandView(
+            self.dealer_hand_layout, self.card_pool, self.animations
+        )
 
         # --- Player Area ---
         self.player_area_label = QLabel("Player Hands")
@@ -80,6 +102,12 @@ class MainWindow(QMainWindow):
 
         self.player_hand_layout = QHBoxLayout()
         self.player_hand_layout.setAlignment(Qt.AlignCenter)
+        num_seats = len(self.engine.players)
+        self.seat_views = [
+            SeatView(i, self.player_hand_layout, self.card_pool, self.animations,
+                     show_title=num_seats > 1)
+            for i in range(num_seats)
+        ]
 
         # --- Message Area ---
         self.message_label = QLabel("Place your bet to start!")
@@ -87,6 +115,11 @@ class MainWindow(QMainWindow):
         self.message_label.setAlignment(Qt.AlignCenter)
         self.message_label.setStyleSheet("font-size: 28px;")
 
+        # --- Hint (best action from the EV oracle) ---
+        self.hint_label = QLabel("")
+        self.hint_label.setObjectName("HintLabel")
+        self.hint_label.setAlignment(Qt.AlignCenter)
+
         # --- Controls ---
         controls_layout = QHBoxLayout()
         controls_layout.setAlignment(Qt.AlignCenter)
@@ -133,7 +166,9 @@ class MainWindow(QMainWindow):
         bet_layout.addLayout(bet_controls_layout)
 
         # Balance
-        self.balance_label = QLabel(f"Balance: ${self.engine.player.balance}")
+        self.balance_label = QLabel(
+            f"Balance: ${self.engine.player.balance}" if self.engine.is_ready else "Balance: ..."
+        )
         self.balance_label.setObjectName("BalanceLabel")
         bet_layout.addWidget(self.balance_label)
 
@@ -141,8 +176,19 @@ class MainWindow(QMainWindow):
         self.deal_button = QPushButton("DEAL")
         self.deal_button.setFixedHeight(50)
         self.deal_button.setObjectName("DealButton")
+        self.deal_button.setEnabled(self.engine.is_ready)  # Until stats load
         bet_layout.addWidget(self.deal_button)
 
+        # Turbo: cards appear instantly instead of flying in
+        self.turbo_checkbox = QCheckBox("Turbo")
+        self.turbo_checkbox.setObjectName("TurboCheckBox")
+        bet_layout.addWidget(self.turbo_checkbox)
+
+        # Shows the running and true counts of the shoe
+        self.count_checkbox = QCheckBox("Show count")
+        self.count_checkbox.setObjectName("CountCheckBox")
+        bet_layout.addWidget(self.count_checkbox)
+
         # --- Action Buttons ---
         self.hit_button = QPushButton("HIT")
         self.stand_button = QPushButton("STAND")
@@ -170,6 +216,7 @@ class MainWindow(QMainWindow):
         main_layout.addLayout(self.dealer_hand_layout)
         main_layout.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
         main_layout.addWidget(self.message_label)
+        main_layout.addWidget(self.hint_label)
         main_layout.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
         main_layout.addWidget(self.player_area_label)
         main_layout.addLayout(self.player_hand_layout)
@@ -186,6 +233,8 @@ class MainWindow(QMainWindow):
 
         self.bet_increase_btn.clicked.connect(self.on_bet_increase)
         self.bet_decrease_btn.clicked.connect(self.on_bet_decrease)
+        self.turbo_checkbox.toggled.connect(self.animations.set_turbo)
+        self.count_checkbox.toggled.connect(self.on_count_toggled)
 
         self.engine.round_started.connect(self.on_round_started)
         self.engine.card_dealt.connect(self.on_card_dealt)
@@ -195,30 +244,14 @@ class MainWindow(QMainWindow):
         self.engine.player_split_successful.connect(self.on_player_split)
         self.engine.next_hand_turn.connect(self.on_next_hand)
         self.engine.offer_insurance.connect(self.on_offer_insurance)
-
-    def _clear_layout_widgets(self, layout):
-        if layout is None:
-            return
-        while layout.count():
-            item = layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.setParent(None)
-                widget.deleteLater()
-            else:
-                child = item.layout()
-                if child:
-                    self._clear_layout_widgets(child)
-                    child.deleteLater()
+        self.engine.stats_loaded.connect(self.on_stats_loaded)
 
     def clear_table(self):
-        self._clear_layout_widgets(self.dealer_hand_layout)
-        self.dealer_hand_widgets = []
-        self._clear_layout_widgets(self.player_hand_layout)
-        self.player_hands_widgets = []
-        self.player_hands_layouts = []
-        self.player_hands_score_labels = []
-        self.animating_cards = []
+        self.animations.clear()
+        self.dealer_hand_view.clear()
+        for seat_view in self.seat_views:
+            seat_view.clear()
+        self.dealer_revealed = False
 
     def _get_current_bet(self) -> int:
         return int(self.bet_display.text().replace("$", ""))
@@ -246,7 +279,48 @@ class MainWindow(QMainWindow):
 
     def _show_betting_controls(self, show: bool):
         self.deal_button.setVisible(show)
-        self.deal_button.setEnabled(show)
+        self.deal_button.setEnabled(show and self.engine.is_ready)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._painted:
+            self._painted = True
+            # Queued, so listeners run after this frame is on screen
+            QTimer.singleShot(0, self.first_frame.emit)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._place_count_label()
+
+    def _place_count_label(self):
+        self.count_label.adjustSize()
+        width = self.centralWidget().width()
+        self.count_label.move(width - self.count_label.width() - 20, 20)
+
+    @Slot(bool)
+    def on_count_toggled(self, checked: bool):
+        self.count_label.setVisible(checked)
+        if checked:
+            self._update_count()
+            self.count_label.raise_()
+
+    def _update_count(self):
+        if not self.count_label.isVisible():
+            return
+        lines = [
+            f"{name}: RC {running:+d}  TC {true:+.1f}"
+            for name, (running, true) in self.engine.get_counts().items()
+        ]
+        lines.append(f"Decks left: {self.engine.counter.decks_remaining:.1f}")
+        text = "\n".join(lines)
+        if self.count_label.text() != text:
+            self.count_label.setText(text)
+            self._place_count_label()
+
+    @Slot(int)
+    def on_stats_loaded(self, balance: int):
+        self.balance_label.setText(f"Balance: ${balance}")
+        self.deal_button.setEnabled(not self.deal_button.isHidden())
 
     def _show_action_controls(self, show: bool):
         for btn in (self.hit_button, self.stand_button, self.double_button, self.split_button):
@@ -263,86 +337,81 @@ class MainWindow(QMainWindow):
 
     @Slot(GameState)
     def on_round_started(self, state: GameState):
-        self.clear_table()
+        self.reset_timer.stop()
         self._show_betting_controls(False)
         self._show_action_controls(False)
         self._show_insurance_controls(False)
 
-        self.animating_cards = []
-        self.animate_initial_deal(state)
-        self.animation_timer.start(800)
+        # Re-sent after insurance is settled: the cards are already out.
+        if not self._is_on_table(state):
+            self.clear_table()
+            self.animate_initial_deal(state)
+        self.animations.when_idle(self.finish_animations)
+
+    def _is_on_table(self, state: GameState) -> bool:
+        return self.dealer_hand_view.codes() == state.dealer.cards and all(
+            seat_view.shows(seat) for seat_view, seat in zip(self.seat_views, state.seats)
+        )
 
     def animate_initial_deal(self, state: GameState):
-        # Deck center (top-left reference point)
-        deck_global = self.deck_reference.mapToGlobal(self.deck_reference.rect().center())
-
-        # Player and dealer target centers
-        player_widget = self.player_hand_layout.parentWidget()
-        player_global = player_widget.mapToGlobal(player_widget.rect().center())
-
-        dealer_widget = self.dealer_hand_layout.parentWidget()
-        dealer_global = dealer_widget.mapToGlobal(dealer_widget.rect().center())
-
-        # Cards: (card, layout, show_front)
-        cards = [
-            (state.player.hands[0].cards[0], self.player_hand_layout, True),
-            (state.dealer.hand.cards[0], self.dealer_hand_layout, False),
-            (state.player.hands[0].cards[1], self.player_hand_layout, True),
-            (state.dealer.hand.cards[1], self.dealer_hand_layout, True),
+        # Cards fly in the order they were dealt: a card to every seat,
+        # the hole card face down, a second card to every seat, the upcard
+        dealer_cards = state.dealer.cards
+        seated = [
+            (seat_view.hand_view(0), seat.hands[0].cards)
+            for seat_view, seat in zip(self.seat_views, state.seats) if seat.seated
         ]
 
-        offset = 0
-        for card, target_layout, show_front in cards:
-            cw = CardWidget(card, self.centralWidget())
-            cw.show_front() if show_front else cw.show_back()
-
-            start_pos = deck_global - QPoint(60, 80)
-            cw.move(start_pos)
-            cw.raise_()
-            cw.show()
-
-            base_center = player_global if target_layout == self.player_hand_layout else dealer_global
-            end_pos = base_center + QPoint(offset * 80, 0)
-            offset += 1
-
-            anim = QPropertyAnimation(cw, b"pos", self)
-            anim.setDuration(600)
-            anim.setStartValue(start_pos)
-            anim.setEndValue(end_pos)
-            anim.setEasingCurve(QEasingCurve.OutQuad)
-            anim.start()
-
-            self.animating_cards.append((cw, target_layout, end_pos))
+        for view, cards in seated:
+            view.deal(cards[0])
+        self.dealer_hand_view.deal(dealer_cards[0], face_up=False)
+        for view, cards in seated:
+            view.deal(cards[1])
+        self.dealer_hand_view.deal(dealer_cards[1])
 
     @Slot()
     def finish_animations(self):
-        for cw, layout, end_pos in self.animating_cards:
-            local_pos = layout.parentWidget().mapFromGlobal(end_pos)
-            cw.setParent(layout.parentWidget())
-            layout.addWidget(cw)
-            cw.move(local_pos)
-        self.animating_cards = []
-
-        self.update_ui(self.engine.get_game_state())
+        """Runs once the opening cards have landed."""
+        state = self.engine.get_game_state()
+        self.update_ui(state)
+        if not state.in_progress:
+            return
 
-        if not self.engine.insurance_is_offered:
+        if not state.insurance_offered:
             self._show_action_controls(True)
-            hand = self.engine.player.hands[0]
+            hand = state.active_hand
             self.double_button.setEnabled(hand.can_double_down)
             self.split_button.setEnabled(hand.can_split)
-            self.message_label.setText("Good luck!")
+            if len(state.seats) > 1:
+                self.message_label.setText(f"Seat {state.active_seat + 1}: your turn")
+            else:
+                self.message_label.setText("Good luck!")
+            self._update_hint()
+
+    def _update_hint(self):
+        values = self.engine.get_action_values()
+        if values is None:
+            self.hint_label.setText("")
+        elif self.engine.insurance_is_offered:
+            choice = "take" if values.take_insurance else "decline"
+            self.hint_label.setText(f"Hint: {choice} insurance")
+        else:
+            best = values.best_action
+            self.hint_label.setText(f"Hint: {best.upper()} (EV {getattr(values, best):+.3f})")
 
     @Slot(GameState)
     def on_card_dealt(self, state: GameState):
         self.update_ui(state)
         if self.hit_button.isVisible():
-            hand = state.player.hands[state.active_hand_index]
+            hand = state.active_hand
             self.double_button.setEnabled(hand.can_double_down)
             self.split_button.setEnabled(hand.can_split)
+            self._update_hint()
 
     @Slot(GameState)
     def on_dealer_finished(self, state: GameState):
-        self.update_ui(state, reveal_dealer=True)
+        self.dealer_revealed = True
+        self.update_ui(state)
 
     @Slot(str, str, int, int)
     def on_round_over(self, simple_summary: str, detailed_summary: str, payout: int, new_balance: int):
@@ -350,6 +419,10 @@ class MainWindow(QMainWindow):
         self._show_action_controls(False)
         self._show_insurance_controls(False)
         self._show_betting_controls(True)
+        self.hint_label.setText("")
+        self._update_count()  # The hole card is counted now
+        # The hole card's face is known now, even if it stays face down
+        self.dealer_hand_view.sync(self.engine.get_game_state().dealer.cards)
 
         win_text = simple_summary
         payout_text = f"Payout: ${payout}" if payout >= 0 else f"Lost: ${-payout}"
@@ -358,12 +431,14 @@ class MainWindow(QMainWindow):
         self.message_label.setText(full_msg)
         self.message_label.setStyleSheet("color: #d4af37; font-weight: bold; font-size: 32px;")
 
-        QTimer.singleShot(5000, lambda: [
-            self.clear_table(),
-            self.message_label.setText("Place your bet to start!"),
-            self.message_label.setStyleSheet("font-size: 28px;"),
-            self.dealer_score_label.setText("Dealer: ?")
-        ])
+        self.reset_timer.start(5000)
+
+    @Slot()
+    def reset_table(self):
+        self.clear_table()
+        self.message_label.setText("Place your bet to start!")
+        self.message_label.setStyleSheet("font-size: 28px;")
+        self.dealer_score_label.setText("Dealer: ?")
 
     @Slot(str)
     def on_show_message(self, msg: str):
@@ -372,66 +447,61 @@ class MainWindow(QMainWindow):
     @Slot(GameState)
     def on_player_split(self, state: GameState):
         self.update_ui(state)
-        hand = state.player.hands[state.active_hand_index]
+        hand = state.active_hand
         self.double_button.setEnabled(hand.can_double_down)
         self.split_button.setEnabled(hand.can_split)
+        self._update_hint()
 
     @Slot(GameState)
     def on_next_hand(self, state: GameState):
         self.update_ui(state)
-        hand = state.player.hands[state.active_hand_index]
+        hand = state.active_hand
         self.double_button.setEnabled(hand.can_double_down)
         self.split_button.setEnabled(hand.can_split)
+        self._update_hint()
 
     @Slot(GameState)
     def on_offer_insurance(self, state: GameState):
-        self.message_label.setText("Dealer has Ace. Insurance?")
+        if len(state.seats) > 1:
+            self.update_ui(state)  # Highlights the seat being asked
+            self.message_label.setText(f"Seat {state.active_seat + 1}: Dealer has Ace. Insurance?")
+        else:
+            self.message_label.setText("Dealer has Ace. Insurance?")
         self._show_action_controls(False)
         self._show_insurance_controls(True)
+        self._update_hint()
+
+    @staticmethod
+    def _set_text(label: QLabel, text: str):
+        if label.text() != text:
+            label.setText(text)
 
     def update_ui(self, state: GameState, reveal_dealer: bool = False):
-        self._clear_layout_widgets(self.player_hand_layout)
-        self._clear_layout_widgets(self.dealer_hand_layout)
-        self.dealer_hand_widgets = []
-        self.player_hands_widgets = []
-        self.player_hands_layouts = []
-        self.player_hands_score_labels = []
-
-        for i, hand in enumerate(state.player.hands):
-            vlay = QVBoxLayout()
-            vlay.setAlignment(Qt.AlignCenter)
-            score = QLabel(f"Hand {i+1}: {hand.value}")
-            score.setObjectName("ScoreLabel")
-            if i == state.active_hand_index and len(state.player.hands) > 1:
-                score.setStyleSheet(f"color: {GOLD_ACCENT};")
-            vlay.addWidget(score)
-
-            hlay = QHBoxLayout()
-            hand_widgets = []
-            for card in hand.cards:
-                cw = CardWidget(card)
-                cw.show_front()
-                hlay.addWidget(cw)
-                hand_widgets.append(cw)
-            vlay.addLayout(hlay)
-            self.player_hand_layout.addLayout(vlay)
-
-            self.player_hands_layouts.append(vlay)
-            self.player_hands_score_labels.append(score)
-            self.player_hands_widgets.append(hand_widgets)
-
-        for i, card in enumerate(state.dealer.hand.cards):
-            cw = CardWidget(card)
-            if i == 0 and not reveal_dealer:
-                cw.show_back()
-            else:
-                cw.show_front()
-            self.dealer_hand_layout.addWidget(cw)
-            self.dealer_hand_widgets.append(cw)
+        """
+        Reconciles the table with `state`: deals newly drawn cards,
+        updates labels in place and flips the hole card on reveal.
+        """
+        reveal_dealer = reveal_dealer or self.dealer_revealed
+
+        # Highlight whose turn it is once there is more than one hand
+        highlight = sum(len(seat.hands) for seat in state.seats) > 1
+        for i, (seat_view, seat) in enumerate(zip(self.seat_views, state.seats)):
+            active = state.active_hand_index if i == state.active_seat else None
+            seat_view.sync(seat, active, highlight)
+
+        dealer_view = self.dealer_hand_view
+        dealer_view.sync(state.dealer.cards)
+        if dealer_view.card_widgets:
+            hole = dealer_view.card_widgets[0]
+            if reveal_dealer and not hole.is_face_up:
+                hole.flip()
+            elif not reveal_dealer and hole.is_face_up:
+                hole.show_back()
 
         if reveal_dealer:
-            self.dealer_score_label.setText(f"Dealer: {state.dealer.hand.value}")
+            self._set_text(self.dealer_score_label, f"Dealer: {state.dealer.value}")
         else:
-            self.dealer_score_label.setText(f"Dealer: {state.dealer.visible_value}")
+            self._set_text(self.dealer_score_label, f"Dealer: {state.dealer_visible_value}")
 
-        self.balance_label.setText(f"Balance: ${state.player.balance}")
\ No newline at end of file
+        self._set_text(self.balance_label, f"Balance: ${state.seats[0].balance}")
+        self._update_count()
@@ -15,7 +15,15 @@ def create_flip_animation(widget: QWidget) -> QPropertyAnimation:
     """
     anim = QPropertyAnimation(widget, b"geometry")
     anim.setDuration(400) # 400ms for the total flip
-    
+    anim.setEasingCurve(QEasingCurve.InOutQuad)
+    set_flip_keyframes(anim, widget)
+    return anim
+
+def set_flip_keyframes(anim: QPropertyAnimation, widget: QWidget):
+    """
+    (Re)computes a flip animation's keyframes from the widget's current
+    geometry, so one animation object can be reused for many flips.
+    """
     start_rect = widget.geometry()
     mid_rect = QRect(
         start_rect.x() + start_rect.width() // 2,
@@ -24,13 +32,10 @@ def create_flip_animation(widget: QWidget) -> QPropertyAnimation:
         start_rect.height()
     )
     end_rect = start_rect
-    
-    anim.setEasingCurve(QEasingCurve.InOutQuad)
+
     anim.setKeyValueAt(0, start_rect)
     anim.setKeyValueAt(0.5, mid_rect)
     anim.setKeyValueAt(1, end_rect)
-    
-    return anim
 
 # --- NEW FUNCTION ---
 def create_deal_animation(
@@ -18,3 +18,10 @@ CARD_ASSET_PATH = "assets/cards/"
 CHIP_ASSET_PATH = "assets/chips/"
 SOUND_ASSET_PATH = "assets/sounds/"
 FONT_ASSET_PATH = "assets/fonts/"
+
+# --- Stats Keys (single-player desktop game) ---
+DEFAULT_PLAYER_ID = "player"
+DEFAULT_TABLE_ID = "main"
+
+# --- Generated Data ---
+STRATEGY_CACHE_PATH = ".cache/strategy/"
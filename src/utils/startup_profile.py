@@ -0,0 +1,44 @@
+"""
+Startup timing for `python main.py --profile-startup`.
+"""
+
+import time
+from typing import Optional
+
+
+class StartupProfiler:
+    """
+    Records how long each startup phase took. Phases are measured back
+    to back: mark(name) closes the phase that began at the previous mark.
+    When disabled every call is a no-op.
+    """
+
+    def __init__(self, enabled: bool = False, started_at: Optional[float] = None):
+        self.enabled = enabled
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        self._last = self.started_at
+        self.phases: list[tuple[str, float, bool]] = []  # (phase, seconds, background)
+
+    def mark(self, phase: str):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last, False))
+        self._last = now
+
+    def add(self, phase: str, seconds: float):
+        """Records a phase timed elsewhere (e.g. on a background thread)."""
+        if self.enabled:
+            self.phases.append((phase, seconds, True))
+
+    def report(self):
+        if not self.enabled:
+            return
+        print(f"Startup profile:{'phase':>25} {'since start':>12}")
+        elapsed = 0.0
+        for phase, seconds, background in self.phases:
+            if background:
+                print(f"  {phase:<28} {seconds * 1000:8.1f} ms  (in parallel)")
+            else:
+                elapsed += seconds
+                print(f"  {phase:<28} {seconds * 1000:8.1f} ms {elapsed * 1000:9.1f} ms")
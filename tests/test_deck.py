@@ -0,0 +1,63 @@
+from collections import Counter
+
+from src.game.counting import KO, CountTracker
+from src.game.deck import CARDS, COMPOSITION_INDICES, DECK_COMPOSITION, Shoe
+from src.game.rng import make_rng
+
+
+def make_shoe(num_decks: int = 2) -> Shoe:
+    return Shoe(num_decks=num_decks, verbose=False, rng=make_rng(1))
+
+
+def test_card_codes_round_trip():
+    for code, card in enumerate(CARDS):
+        assert card.code == code
+        assert CARDS[card.code] is card
+
+
+def test_new_shoe_holds_complete_decks():
+    shoe = make_shoe(2)
+    assert len(shoe) == 104
+    assert Counter(card.code for card in shoe.cards) == {code: 2 for code in range(52)}
+    assert shoe.composition() == tuple(2 * count for count in DECK_COMPOSITION)
+
+
+def test_composition_after_dealing():
+    shoe = make_shoe(2)
+    dealt = [shoe.deal_code() for _ in range(30)]
+
+    expected = [2 * count for count in DECK_COMPOSITION]
+    for code in dealt:
+        expected[COMPOSITION_INDICES[code]] -= 1
+    assert shoe.composition() == tuple(expected)
+    assert len(shoe) == 104 - 30
+
+
+def test_reshuffle_only_past_the_marker():
+    shoe = make_shoe(2)
+    while len(shoe) > shoe.reshuffle_threshold:
+        shoe.deal_code()
+    assert not shoe.reshuffle_if_due()
+
+    shoe.deal_code()
+    assert len(shoe) < shoe.reshuffle_threshold
+    assert shoe.reshuffle_if_due()
+    assert len(shoe) == 104
+
+
+def test_dealing_never_reshuffles_before_empty():
+    shoe = make_shoe(1)
+    for _ in range(52):
+        shoe.deal_code()
+    assert len(shoe) == 0
+
+    shoe.deal_code()  # Rebuilds, then deals
+    assert len(shoe) == 51
+
+
+def test_counter_takes_the_shoe_deck_count():
+    counter = CountTracker(num_decks=6)
+    Shoe(num_decks=2, verbose=False, rng=make_rng(1), counter=counter)
+    assert counter.num_decks == 2
+    assert counter.remaining == 104
+    assert counter.running_count(KO.name) == KO.initial_count(2)
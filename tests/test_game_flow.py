@@ -0,0 +1,60 @@
+from src.game.deck import NUM_CARDS, Card, Rank, Shoe, Suit
+from src.game.player import Player
+from src.game.rules import GameRules
+from src.logic.round_engine import RoundEngine
+
+
+class StackedPool:
+    """Stands in for a ShufflePool: every shoe starts with `top`."""
+
+    def __init__(self, top: list[Card], num_decks: int = 1):
+        self.num_decks = num_decks
+        self.top = [card.code for card in top]
+
+    def next_shoe(self) -> bytearray:
+        rest = list(range(NUM_CARDS)) * self.num_decks
+        for code in self.top:
+            rest.remove(code)
+        return bytearray(self.top + rest)
+
+
+def stacked_engine(*ranks: Rank, balance: int = 1000) -> RoundEngine:
+    suits = [Suit.HEARTS, Suit.CLUBS, Suit.DIAMONDS, Suit.SPADES]
+    top = [Card(rank, suits[i % 4]) for i, rank in enumerate(ranks)]
+    shoe = Shoe(num_decks=1, verbose=False, shuffle_pool=StackedPool(top))
+    return RoundEngine(shoe=shoe, player=Player(balance=balance), rules=GameRules())
+
+
+def test_deal_split_double_settle():
+    # Player 8, hole 10, player 8, upcard 6; split hands draw 3 and 2,
+    # the doubles draw 10 and 9, the dealer draws a 10 and busts.
+    engine = stacked_engine(
+        Rank.EIGHT, Rank.TEN, Rank.EIGHT, Rank.SIX,
+        Rank.THREE, Rank.TWO, Rank.TEN, Rank.NINE, Rank.KING,
+    )
+
+    assert engine.deal(10)
+    assert len(engine.dealer.hand.cards) == 2
+    assert engine.player.balance == 990
+
+    assert engine.split()
+    assert [hand.value for hand in engine.player.hands] == [11, 10]
+    assert engine.double()  # Hand 1: 11 + 10 = 21
+    assert engine.double()  # Hand 2: 10 + 9 = 19
+
+    assert not engine.in_progress
+    assert engine.dealer.hand.is_bust
+    outcome = engine.last_outcome
+    assert outcome.total_bet == 40
+    assert outcome.total_payout == 80
+    assert engine.player.balance == 1040
+
+
+def test_dealer_blackjack_takes_the_bet():
+    engine = stacked_engine(Rank.NINE, Rank.ACE, Rank.NINE, Rank.KING)
+
+    assert engine.deal(10)
+    assert len(engine.dealer.hand.cards) == 2
+    assert not engine.insurance_is_offered  # The upcard is a King
+    assert not engine.in_progress
+    assert engine.player.balance == 990
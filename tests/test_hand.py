@@ -0,0 +1,68 @@
+from src.game.deck import Card, Rank, Suit
+from src.game.hand import Hand
+
+
+def make_hand(*ranks: Rank) -> Hand:
+    return Hand(cards=[Card(rank, Suit.SPADES) for rank in ranks])
+
+
+def test_hard_total():
+    hand = make_hand(Rank.TEN, Rank.SIX)
+    assert hand.value == 16
+    assert not hand.is_soft
+    assert not hand.is_bust
+
+
+def test_soft_total_turns_hard():
+    hand = make_hand(Rank.ACE, Rank.SIX)
+    assert hand.value == 17
+    assert hand.is_soft
+
+    hand.add_card(Card(Rank.NINE, Suit.HEARTS))
+    assert hand.value == 16
+    assert not hand.is_soft
+
+
+def test_several_aces():
+    hand = make_hand(Rank.ACE, Rank.ACE, Rank.NINE)
+    assert hand.value == 21
+    assert hand.is_soft
+
+    hand.add_card(Card(Rank.ACE, Suit.HEARTS))
+    assert hand.value == 12
+    assert not hand.is_soft
+
+
+def test_bust():
+    hand = make_hand(Rank.KING, Rank.QUEEN, Rank.TWO)
+    assert hand.value == 22
+    assert hand.is_bust
+
+
+def test_blackjack():
+    assert make_hand(Rank.ACE, Rank.KING).is_blackjack
+    assert not make_hand(Rank.ACE, Rank.FIVE, Rank.FIVE).is_blackjack
+    assert not make_hand(Rank.TEN, Rank.KING).is_blackjack
+
+
+def test_pop_card_after_split():
+    hand = make_hand(Rank.ACE, Rank.ACE)
+    assert hand.can_split
+    assert hand.value == 12
+
+    moved = hand.pop_card(1)
+    assert moved.rank == Rank.ACE
+    assert hand.value == 11
+    assert hand.is_soft
+
+    hand.add_card(Card(Rank.KING, Suit.HEARTS))
+    assert hand.value == 21
+    assert hand.is_blackjack  # Two cards; the engine decides how a split hand pays
+
+
+def test_clear_resets_totals():
+    hand = make_hand(Rank.ACE, Rank.NINE)
+    hand.clear()
+    assert hand.cards == []
+    assert hand.value == 0
+    assert not hand.is_soft
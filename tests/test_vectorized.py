@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from src.game.rules import GameRules
+from src.simulation.vectorized import cross_check, draw_shoe_slices, evaluate_batch
+
+
+@pytest.mark.parametrize("take_insurance", [False, True])
+def test_vectorized_results_match_scalar_rules(take_insurance):
+    rules = GameRules()
+    slices = draw_shoe_slices(np.random.default_rng(42), 5000)
+    result = evaluate_batch(slices, rules, take_insurance=take_insurance)
+
+    mismatches = cross_check(
+        slices, result, rules, take_insurance=take_insurance, sample=5000
+    )
+
+    assert mismatches == []
+
+
+def test_vectorized_results_match_scalar_rules_s17():
+    rules = GameRules(dealer_hits_on_soft_17=False)
+    slices = draw_shoe_slices(np.random.default_rng(7), 2000)
+    result = evaluate_batch(slices, rules, stand_on=13)
+
+    assert cross_check(slices, result, rules, stand_on=13, sample=2000) == []